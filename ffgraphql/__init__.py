@@ -2,15 +2,29 @@
 
 """Top-level package for fightfor-graphql."""
 
+import importlib
+
 __author__ = """Adamos Kyriakou"""
 __email__ = 'adam@bearnd.io'
 __version__ = '0.22.0'
 
-from ffgraphql import config
-from ffgraphql import excs
-from ffgraphql import loggers
-from ffgraphql import schema
-from ffgraphql import types
-from ffgraphql import resources
-from ffgraphql import api
-from ffgraphql import ffgraphql
+# The submodules are imported lazily upon first access as importing the schema
+# and types pulls in Graphene and the SQLAlchemy ORM.
+__all__ = [
+    "config",
+    "excs",
+    "loggers",
+    "schema",
+    "types",
+    "resources",
+    "api",
+    "ffgraphql",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module("ffgraphql.{}".format(name))
+
+    msg = "module '{}' has no attribute '{}'"
+    raise AttributeError(msg.format(__name__, name))
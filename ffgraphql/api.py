@@ -6,8 +6,9 @@ import graphene
 import sqlalchemy.orm
 
 from ffgraphql.loggers import create_logger
-from ffgraphql.middlewares.auth0 import MiddlewareCors
+from ffgraphql.middlewares.cors import MiddlewareCors
 from ffgraphql.middlewares.auth0 import MiddlewareAuth0
+from ffgraphql.middlewares.session import MiddlewareSession
 from ffgraphql.resources import ResourceGraphQlSqlAlchemy
 
 
@@ -40,11 +41,24 @@ def create_api(
         logger_level=logger_level
     )
 
+    # Create the router of the API so that it can be passed to the CORS
+    # middleware.
+    router = falcon.routing.CompiledRouter()
+
     # Create the API.
     api = falcon.API(
+        router=router,
         middleware=[
-            # Instantiate and add the CORS middleware.
-            MiddlewareCors(logger_level=logger_level),
+            # Instantiate and add the session middleware removing the
+            # scoped-session at the end of each request.
+            MiddlewareSession(
+                scoped_session=scoped_session,
+                logger_level=logger_level,
+            ),
+            # Instantiate and add the CORS middleware. This needs to precede
+            # the Auth0 middleware as it responds to CORS OPTIONS preflight
+            # requests before they reach any subsequent middleware.
+            MiddlewareCors(router=router, logger_level=logger_level),
             # Instantiate and add the Auth0 authentication middleware.
             MiddlewareAuth0(
                 auth0_domain=cfg.auth0.domain,
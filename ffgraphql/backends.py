@@ -0,0 +1,152 @@
+# coding=utf-8
+
+"""
+This module defines a `GraphQlBackendCached` class meant to be used as the
+GraphQL backend of the schema execution which caches parsed and validated
+GraphQL documents so that repeated queries skip parsing and validation.
+"""
+
+import hashlib
+import threading
+import functools
+from collections import OrderedDict
+
+import graphql
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import ExecutionResult
+from graphql.execution.executors.sync import SyncExecutor
+from graphql.language.ast import Document
+
+
+class GraphQlBackendCached(GraphQLCoreBackend):
+    """ GraphQL backend caching parsed and validated GraphQL documents in a
+        bounded least-recently-used cache keyed by a hash of the query string.
+    """
+
+    def __init__(self, maxsize: int = 512, executor=None):
+        """ Constructor.
+
+        Args:
+            maxsize (int): The maximum number of documents held in the cache.
+                Defaults to `512`.
+            executor (Optional[Any]): The executor used when executing the
+                documents. Defaults to `None` in which case a single
+                synchronous executor is created and reused across executions.
+        """
+
+        # Reuse a single executor instead of having one created upon every
+        # execution.
+        if executor is None:
+            executor = SyncExecutor()
+
+        super(GraphQlBackendCached, self).__init__(executor=executor)
+
+        # Internalize arguments.
+        self.maxsize = maxsize
+
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def hash_document_string(document_string: str) -> bytes:
+        """ Hashes a GraphQL query string into a cache key.
+
+        Args:
+            document_string (str): The GraphQL query string.
+
+        Returns:
+            bytes: The digest of the query string.
+        """
+
+        return hashlib.blake2b(
+            document_string.encode("utf-8"),
+            digest_size=16,
+        ).digest()
+
+    def _create_document(
+        self,
+        schema: graphql.GraphQLSchema,
+        document_string: str,
+    ) -> GraphQLDocument:
+        """ Parses and validates a GraphQL query string and creates a document
+            which executes the parsed AST without re-validating it.
+
+        Args:
+            schema (graphql.GraphQLSchema): The schema against which the query
+                is validated.
+            document_string (str): The GraphQL query string.
+
+        Returns:
+            GraphQLDocument: The created document.
+        """
+
+        document_ast = graphql.parse(document_string)
+
+        # Validate the document once. Should validation fail then the document
+        # will always respond with the validation errors.
+        errors = graphql.validate(schema, document_ast)
+        if errors:
+            def execute(*args, **kwargs):
+                return ExecutionResult(errors=errors, invalid=True)
+        else:
+            execute = functools.partial(
+                graphql.execute,
+                schema,
+                document_ast,
+                **self.execute_params
+            )
+
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=execute,
+        )
+
+        return document
+
+    def document_from_string(
+        self,
+        schema: graphql.GraphQLSchema,
+        document_string: str,
+    ) -> GraphQLDocument:
+        """ Retrieves the document for a GraphQL query string out of the cache
+            or creates and caches it if it doesn't exist.
+
+        Args:
+            schema (graphql.GraphQLSchema): The schema against which the query
+                is validated.
+            document_string (str): The GraphQL query string.
+
+        Returns:
+            GraphQLDocument: The cached or newly created document.
+        """
+
+        # Pre-parsed documents are not cached.
+        if isinstance(document_string, Document):
+            return super(GraphQlBackendCached, self).document_from_string(
+                schema=schema,
+                document_string=document_string,
+            )
+
+        key = (id(schema), self.hash_document_string(document_string))
+
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+
+        document = self._create_document(
+            schema=schema,
+            document_string=document_string,
+        )
+
+        with self._lock:
+            self._documents[key] = document
+            # Evict the least-recently-used document if the cache is full.
+            if len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+        return document
@@ -0,0 +1,107 @@
+# coding=utf-8
+
+"""
+This module defines a `CacheLru` class implementing a thread-safe bounded
+least-recently-used cache with optional time-to-live expiry of its entries.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class CacheLru(object):
+    """ Thread-safe bounded least-recently-used cache with optional
+        time-to-live expiry of its entries.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """ Constructor.
+
+        Args:
+            maxsize (int): The maximum number of entries held in the cache.
+            ttl (Optional[float] = None): The number of seconds after which an
+                entry expires. Defaults to `None` in which case entries never
+                expire.
+        """
+
+        # Internalize arguments.
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        # Entries are stored as `(value, expires_at)` tuples.
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """ Retrieves the value of a cached entry.
+
+        Args:
+            key (Hashable): The key of the entry.
+            default (Any): The value returned if no entry exists under the key
+                or the entry has expired. Defaults to `None`.
+
+        Returns:
+            Any: The cached value or `default`.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """ Caches a value under a key evicting the least-recently-used entry
+            should the cache be full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to be cached.
+        """
+
+        if self.ttl is None:
+            expires_at = None
+        else:
+            expires_at = time.monotonic() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """ Removes an entry from the cache.
+
+        Args:
+            key (Hashable): The key of the entry.
+            default (Any): The value returned if no entry exists under the key.
+                Defaults to `None`.
+
+        Returns:
+            Any: The value of the removed entry or `default`.
+        """
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return default
+
+        return entry[0]
+
+    def clear(self):
+        """ Removes all entries from the cache."""
+
+        with self._lock:
+            self._entries.clear()
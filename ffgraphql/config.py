@@ -59,6 +59,16 @@ config_schema_default = {
         "sql_db": {
             "type": "string", "description": "SQL server database name."
         },
+        "sql_pool_size": {
+            "type": "integer",
+            "description": ("Number of connections kept open in the SQL "
+                            "connection pool.")
+        },
+        "sql_max_overflow": {
+            "type": "integer",
+            "description": ("Number of connections the SQL connection pool "
+                            "may open beyond `sql_pool_size`.")
+        },
     }
 }
 
@@ -0,0 +1,72 @@
+# coding=utf-8
+
+"""
+This module defines a `ContextGraphQl` class holding the per-request context
+passed to the GraphQL resolvers under `info.context`.
+"""
+
+from typing import Any, Dict, Optional
+
+import attrdict
+import sqlalchemy.orm
+from promise.dataloader import DataLoader
+
+
+class ContextGraphQl(object):
+    """ Per-request context passed to the GraphQL resolvers exposing its
+        entries as slot attributes.
+
+    Note:
+        The `get` and `__getitem__` methods are kept so that resolvers which
+        access the context as a `dict` keep working.
+    """
+
+    __slots__ = (
+        "cfg",
+        "token",
+        "token_payload",
+        "session",
+        "loaders",
+        "cache_options",
+    )
+
+    def __init__(
+        self,
+        cfg: attrdict.AttrDict,
+        token: str,
+        token_payload: Dict,
+        session: Optional[sqlalchemy.orm.scoped_session] = None,
+        loaders: Optional[Dict[str, DataLoader]] = None,
+    ):
+        """ Constructor.
+
+        Args:
+            cfg (attrdict.AttrDict): The application configuration.
+            token (str): The access-token of the request.
+            token_payload (Dict): The decoded payload of the access-token.
+            session (Optional[sqlalchemy.orm.scoped_session]): The
+                scoped-session used to interact with the SQL database. Defaults
+                to `None`.
+            loaders (Optional[Dict[str, DataLoader]]): The data-loaders of the
+                request keyed by the name of the retrieved record. Defaults to
+                `None`.
+        """
+
+        self.cfg = cfg
+        self.token = token
+        self.token_payload = token_payload
+        self.session = session
+        self.loaders = loaders
+
+        # Cache of the SQLAlchemy query options collected out of the fields
+        # requested under a given field of the GraphQL query.
+        self.cache_options = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
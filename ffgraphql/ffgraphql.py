@@ -5,6 +5,7 @@
 import os
 import argparse
 
+import sqlalchemy
 import sqlalchemy.orm
 from fform.dal_base import DalBase
 
@@ -38,8 +39,15 @@ def get_cfg(filename_config_file=None):
     return _cfg
 
 
-def main(filename_config_file=None):
-    cfg = load_config(filename_config_file=filename_config_file)
+def build_app(cfg):
+    """Builds the Falcon API serving the GraphQL schema.
+
+    Args:
+        cfg (attrdict.AttrDict): The application configuration.
+
+    Returns:
+        falcon.api.API: The Falcon API.
+    """
 
     # Initialize the Sentry agent.
     initialize_sentry(cfg=cfg)
@@ -53,7 +61,30 @@ def main(filename_config_file=None):
         sql_engine_echo=cfg.logger_level == "DEBUG",
     )
 
-    scoped_session = sqlalchemy.orm.scoped_session(dal.session_factory)
+    # Create an engine over the same database with an explicitly sized
+    # connection pool so that connections are reused across requests. Stale
+    # connections are detected upon checkout and recycled periodically.
+    engine = sqlalchemy.create_engine(
+        dal.engine.url,
+        echo=cfg.logger_level == "DEBUG",
+        pool_size=cfg.get("sql_pool_size", 10),
+        max_overflow=cfg.get("sql_max_overflow", 20),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+    # Dispose of the engine created by `DalBase`, which is only used to
+    # assemble the database URL, so that its pool isn't kept alive alongside
+    # the one above.
+    dal.engine.dispose()
+
+    # Objects aren't expired upon commit so that objects retrieved during a
+    # request don't trigger additional queries when accessed afterwards.
+    session_factory = sqlalchemy.orm.sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+    )
+    scoped_session = sqlalchemy.orm.scoped_session(session_factory)
 
     api = create_api(
         cfg=cfg,
@@ -65,6 +96,30 @@ def main(filename_config_file=None):
     return api
 
 
+def main(filename_config_file=None):
+    cfg = load_config(filename_config_file=filename_config_file)
+
+    api = build_app(cfg=cfg)
+
+    return api
+
+
+def __getattr__(name):
+    # The module-level `application` is built upon first access using the
+    # configuration file defined under the `FFGRAPHQL_CONFIG` environment
+    # variable so that merely importing this module has no side-effects. When
+    # served via `gunicorn --preload ffgraphql.ffgraphql:application` the
+    # application is built once in the master process and shared by the
+    # forked workers.
+    if name == "application":
+        global application
+        application = build_app(cfg=get_cfg())
+        return application
+
+    msg = "module '{}' has no attribute '{}'"
+    raise AttributeError(msg.format(__name__, name))
+
+
 # main sentinel
 if __name__ == "__main__":
 
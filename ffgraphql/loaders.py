@@ -0,0 +1,135 @@
+# coding=utf-8
+
+"""
+This module defines data-loader classes meant to be instantiated once per
+request and coalesce the retrieval of record objects into batched queries.
+"""
+
+from typing import Dict, List
+
+import sqlalchemy.orm
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from ffgraphql.types.app_primitives import ModelUser
+from ffgraphql.types.ct_primitives import ModelStudy
+from ffgraphql.types.ct_primitives import ModelFacility
+from ffgraphql.types.mt_primitives import ModelDescriptor
+from ffgraphql.types.pubmed_primitives import ModelCitation
+from ffgraphql.types.pubmed_primitives import ModelArticle
+
+
+class LoaderBase(DataLoader):
+    """ Base data-loader class retrieving record objects of a given model via
+        a given column through a single `IN` query per batch of keys.
+    """
+
+    model = None
+    column_name = None
+
+    def __init__(self, session: sqlalchemy.orm.Session, **kwargs):
+        """ Constructor.
+
+        Args:
+            session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+                used to perform the interaction with the SQL database.
+        """
+
+        # Internalize arguments.
+        self.session = session
+
+        super(LoaderBase, self).__init__(**kwargs)
+
+    def batch_load_fn(self, keys: List) -> Promise:
+        """ Retrieves the record objects matching the given keys.
+
+        Args:
+            keys (List): The keys for which retrieval will be performed.
+
+        Returns:
+            Promise: A promise resolving to the list of record objects, or
+                `None` where no match was found, in the order of the keys.
+        """
+
+        column = getattr(self.model, self.column_name)
+
+        query = self.session.query(self.model)
+        query = query.filter(column.in_(keys))
+
+        objs_by_key = {
+            getattr(obj, self.column_name): obj for obj in query.all()
+        }
+
+        return Promise.resolve([objs_by_key.get(key) for key in keys])
+
+
+class LoaderUser(LoaderBase):
+    """ Data-loader retrieving `ModelUser` record objects via their Auth0 user
+        IDs.
+    """
+
+    model = ModelUser
+    column_name = "auth0_user_id"
+
+
+class LoaderStudy(LoaderBase):
+    """ Data-loader retrieving `ModelStudy` record objects via their NCT
+        IDs.
+    """
+
+    model = ModelStudy
+    column_name = "nct_id"
+
+
+class LoaderCitation(LoaderBase):
+    """ Data-loader retrieving `ModelCitation` record objects via their PubMed
+        IDs.
+    """
+
+    model = ModelCitation
+    column_name = "pmid"
+
+
+class LoaderFacility(LoaderBase):
+    """ Data-loader retrieving `ModelFacility` record objects via their IDs."""
+
+    model = ModelFacility
+    column_name = "facility_id"
+
+
+class LoaderDescriptor(LoaderBase):
+    """ Data-loader retrieving `ModelDescriptor` record objects via their
+        IDs.
+    """
+
+    model = ModelDescriptor
+    column_name = "descriptor_id"
+
+
+class LoaderArticle(LoaderBase):
+    """ Data-loader retrieving `ModelArticle` record objects via their IDs."""
+
+    model = ModelArticle
+    column_name = "article_id"
+
+
+def create_loaders(session: sqlalchemy.orm.Session) -> Dict[str, DataLoader]:
+    """ Creates the data-loaders to be placed in the context of a request.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+            used to perform the interaction with the SQL database.
+
+    Returns:
+        Dict[str, DataLoader]: The data-loaders keyed by the name of the
+            retrieved record.
+    """
+
+    return {
+        "user": LoaderUser(session=session),
+        "study": LoaderStudy(session=session),
+        "citation": LoaderCitation(session=session),
+        "facility": LoaderFacility(session=session),
+        "descriptor": LoaderDescriptor(session=session),
+        "article": LoaderArticle(session=session),
+    }
@@ -7,16 +7,58 @@ incoming requests and which responds with a 401 if the header or token are
 missing or invalid.
 """
 
+import os
 import re
-from typing import List, Optional
+import time
+import threading
+from typing import Dict, List, Optional
 
 import falcon
+import orjson
 from jose import jwt
+from jose.utils import base64url_decode
 import requests
 
 from ffgraphql.loggers import create_logger
 from ffgraphql.excs import Auth0JwksRetrievalError
-from ffgraphql.middlewares.cors import MiddlewareCors
+
+
+class Auth0Jwks(object):
+    """ Class holding the RSA keys of a retrieved Auth0 JSON Web Key Set along
+        with the information required to refresh it upon expiry.
+    """
+
+    def __init__(
+        self,
+        keys_by_kid: Dict[str, Dict],
+        ttl: float,
+        etag: Optional[str] = None,
+    ):
+        """ Constructor.
+
+        Args:
+            keys_by_kid (Dict[str, Dict]): The RSA keys keyed by their key ID.
+            ttl (float): The number of seconds after which the JWKS should be
+                refreshed.
+            etag (Optional[str] = None): The `ETag` header of the response
+                through which the JWKS was retrieved.
+        """
+
+        # Internalize arguments.
+        self.keys_by_kid = keys_by_kid
+        self.ttl = ttl
+        self.etag = etag
+
+        self.fetched_at = time.monotonic()
+
+    def is_expired(self) -> bool:
+        """ Checks whether the JWKS has outlived its TTL.
+
+        Returns:
+            bool: Whether the JWKS has expired.
+        """
+
+        return time.monotonic() - self.fetched_at >= self.ttl
 
 
 class MiddlewareAuth0(object):
@@ -26,6 +68,16 @@ class MiddlewareAuth0(object):
 
     ALGORITHMS = ["RS256"]
 
+    # The minimum number of seconds the retrieved JWKS will be cached for.
+    JWKS_TTL_MIN = 600
+
+    # The connect and read timeouts in seconds when retrieving the JWKS.
+    JWKS_TIMEOUT = (2, 5)
+
+    # The minimum number of seconds between consecutive on-demand JWKS
+    # refreshes, e.g., triggered by tokens with an unknown key ID.
+    JWKS_REFRESH_COOLDOWN = 60
+
     def __init__(
         self,
         auth0_domain: str,
@@ -50,44 +102,256 @@ class MiddlewareAuth0(object):
         self.auth0_domain = auth0_domain
         self.auth0_audience = auth0_audience
         self.auth0_jwks_url = auth0_jwks_url
+
+        # Assemble the expected token issuer.
+        self.issuer = "https://{}/".format(self.auth0_domain)
         if exlcude:
             self.exclude = exlcude
         else:
             self.exclude = []
 
+        # Union the exclusion regexes into a single compiled alternation so
+        # that each path is matched once.
+        if self.exclude:
+            self._exclude_compiled = re.compile("|".join(
+                "(?:{})".format(exclusion) for exclusion in self.exclude
+            ))
+        else:
+            self._exclude_compiled = None
+
         # Create a class-level logger.
         self.logger = create_logger(
             logger_name=type(self).__name__,
             logger_level=kwargs.get("logger_level", "DEBUG")
         )
 
-        # Retrieve the Auth0 JWKS.
-        self.jwks = self._get_jwks()
+        # The HTTP session used to retrieve the JWKS and the ID of the process
+        # it was created in. Sessions are created per process via `_get_http`
+        # so that forked workers don't share the pooled connection.
+        self._http = None  # type: Optional[requests.Session]
+        self._http_pid = None  # type: Optional[int]
+
+        # The JWKS refresh timer and the ID of the process it was started in.
+        # As threads don't survive a fork the timer is restarted upon the
+        # first request in each forked worker via `_ensure_jwks_refresh`.
+        self._jwks_lock = threading.Lock()
+        self._jwks_timer = None  # type: Optional[threading.Timer]
+        self._jwks_timer_pid = None  # type: Optional[int]
+
+        # Retrieve the Auth0 JWKS and schedule its refresh.
+        self.jwks = self._get_jwks()  # type: Auth0Jwks
+        self._jwks_refreshed_at = time.monotonic()
+        self._schedule_jwks_refresh(interval=self.jwks.ttl)
+
+    def _get_ttl(self, response: requests.Response) -> float:
+        """ Calculates the TTL of a retrieved JWKS out of the `max-age`
+            directive of the response `Cache-Control` header.
+
+        Args:
+            response (requests.Response): The JWKS response.
+
+        Returns:
+            float: The TTL in seconds which will be no less than
+                `JWKS_TTL_MIN`.
+        """
+
+        cache_control = response.headers.get("Cache-Control", "")
+        match = re.search(r"max-age=(\d+)", cache_control)
+        max_age = int(match.group(1)) if match else 0
 
-    def _get_jwks(self):
+        return max(max_age, self.JWKS_TTL_MIN)
+
+    def _get_http(self) -> requests.Session:
+        """ Retrieves the HTTP session of the current process creating it upon
+            first use so that the connection to the Auth0 tenant is pooled and
+            reused across JWKS refreshes but never shared between the processes
+            forked off a preloading master.
+
+        Returns:
+            requests.Session: The HTTP session of the current process.
+        """
+
+        pid = os.getpid()
+        if self._http_pid != pid:
+            self._http = requests.Session()
+            self._http.headers["Accept-Encoding"] = "gzip"
+            self._http_pid = pid
+
+        return self._http
+
+    def _get_jwks(self, jwks: Optional[Auth0Jwks] = None) -> Auth0Jwks:
         """ Retrieves and JSON-decodes the Auth0 JSON Web Key Set from the URL
             defined upon instantiation.
 
+        Args:
+            jwks (Optional[Auth0Jwks] = None): A previously retrieved JWKS. If
+                provided its `ETag` is sent so that an unchanged JWKS doesn't
+                need to be re-downloaded.
+
         Returns:
-            dict: The retrieved and decoded Auth0 JWKS.
+            Auth0Jwks: The retrieved Auth0 JWKS.
         """
 
         msg = "Retrieving the Auth0 JSON Web Key Set from URL '{}'"
         msg_fmt = msg.format(self.auth0_jwks_url)
         self.logger.debug(msg_fmt)
 
+        headers = {}
+        if jwks and jwks.etag:
+            headers["If-None-Match"] = jwks.etag
+
         # Retrieve the JWKS.
-        response = requests.get(url=self.auth0_jwks_url)
+        response = self._get_http().get(
+            url=self.auth0_jwks_url,
+            headers=headers,
+            timeout=self.JWKS_TIMEOUT,
+        )
 
-        if response.ok:
-            jwks = response.json()
-        else:
+        # If the JWKS hasn't changed then reuse the previously retrieved keys.
+        if jwks and response.status_code == 304:
+            return Auth0Jwks(
+                keys_by_kid=jwks.keys_by_kid,
+                ttl=self._get_ttl(response=response),
+                etag=jwks.etag,
+            )
+
+        if not response.ok:
             msg = "Could not retrieve the Auth0 JSON Web Key Set from URL '{}'"
             msg_fmt = msg.format(self.auth0_jwks_url)
             self.logger.error(msg_fmt)
             raise Auth0JwksRetrievalError(msg_fmt)
 
-        return jwks
+        jwks_json = orjson.loads(response.content)
+
+        return Auth0Jwks(
+            keys_by_kid=self._map_keys_by_kid(jwks=jwks_json),
+            ttl=self._get_ttl(response=response),
+            etag=response.headers.get("ETag"),
+        )
+
+    def _schedule_jwks_refresh(self, interval: float):
+        """ Schedules a background refresh of the JWKS.
+
+        Args:
+            interval (float): The number of seconds after which the JWKS will
+                be refreshed.
+        """
+
+        if self._jwks_timer:
+            self._jwks_timer.cancel()
+
+        self._jwks_timer = threading.Timer(
+            interval=interval,
+            function=self._refresh_jwks,
+        )
+        self._jwks_timer.daemon = True
+        self._jwks_timer.start()
+        self._jwks_timer_pid = os.getpid()
+
+    def _ensure_jwks_refresh(self):
+        """ Schedules the background refresh of the JWKS in the current process
+            should it not have been scheduled yet, e.g., in a worker forked off
+            a preloading master whose timer thread didn't survive the fork.
+        """
+
+        pid = os.getpid()
+        if self._jwks_timer_pid == pid:
+            return None
+
+        with self._jwks_lock:
+            if self._jwks_timer_pid == pid:
+                return None
+
+            elapsed = time.monotonic() - self.jwks.fetched_at
+            self._schedule_jwks_refresh(
+                interval=max(self.jwks.ttl - elapsed, 0),
+            )
+
+    def _refresh_jwks(self, do_enforce_cooldown: bool = False):
+        """ Refreshes the JWKS and schedules its next refresh. Should the
+            refresh fail the previously retrieved JWKS is retained and the
+            refresh is retried after `JWKS_REFRESH_COOLDOWN` seconds.
+
+        Args:
+            do_enforce_cooldown (bool = False): Whether to skip the refresh
+                should the JWKS have been refreshed within the last
+                `JWKS_REFRESH_COOLDOWN` seconds.
+        """
+
+        with self._jwks_lock:
+            # Re-check the cooldown under the lock so that concurrent
+            # on-demand refreshes collapse into a single retrieval.
+            elapsed = time.monotonic() - self._jwks_refreshed_at
+            if do_enforce_cooldown and elapsed < self.JWKS_REFRESH_COOLDOWN:
+                return None
+
+            self._jwks_refreshed_at = time.monotonic()
+
+            # Any failure, including a malformed JWKS, is caught so that the
+            # timer thread always schedules the next refresh.
+            interval = self.JWKS_REFRESH_COOLDOWN
+            try:
+                self.jwks = self._get_jwks(jwks=self.jwks)
+                interval = self.jwks.ttl
+            except Exception:
+                msg_fmt = "Could not refresh the Auth0 JSON Web Key Set."
+                self.logger.exception(msg_fmt)
+            finally:
+                self._schedule_jwks_refresh(interval=interval)
+
+    def _get_rsa_key(self, kid: Optional[str]) -> Optional[Dict]:
+        """ Retrieves the RSA key matching a given key ID refreshing the JWKS
+            once should the key ID be unknown or the JWKS have expired.
+
+        Args:
+            kid (Optional[str]): The key ID.
+
+        Returns:
+            Optional[Dict]: The RSA key or `None` if no key matches the key
+                ID.
+        """
+
+        rsa_key = self.jwks.keys_by_kid.get(kid)
+
+        # Ensure the JWKS is refreshed in the background of this process.
+        self._ensure_jwks_refresh()
+
+        # Should the key ID be unknown then the signing keys may have been
+        # rotated so refresh the JWKS once and retry. The same applies to an
+        # expired JWKS should the background refresh have fallen behind.
+        # Refreshes are limited to one every `JWKS_REFRESH_COOLDOWN` seconds
+        # so that tokens with bogus key IDs don't trigger a retrieval each.
+        if rsa_key is None or self.jwks.is_expired():
+            elapsed = time.monotonic() - self._jwks_refreshed_at
+            if elapsed >= self.JWKS_REFRESH_COOLDOWN:
+                self._refresh_jwks(do_enforce_cooldown=True)
+                rsa_key = self.jwks.keys_by_kid.get(kid)
+
+        return rsa_key
+
+    @staticmethod
+    def _map_keys_by_kid(jwks: Dict) -> Dict[str, Dict]:
+        """ Assembles the RSA keys out of an Auth0 JSON Web Key Set and maps
+            them by their key ID.
+
+        Args:
+            jwks (Dict): The retrieved and decoded Auth0 JWKS.
+
+        Returns:
+            Dict[str, Dict]: The RSA keys keyed by their key ID.
+        """
+
+        keys_by_kid = {
+            key["kid"]: {
+                "kty": key["kty"],
+                "kid": key["kid"],
+                "use": key["use"],
+                "n": key["n"],
+                "e": key["e"]
+            } for key in jwks["keys"]
+        }
+
+        return keys_by_kid
 
     def _is_path_excluded(self, path):
         """ Checks if a given `path` matches any of the defined exclusions.
@@ -99,15 +363,13 @@ class MiddlewareAuth0(object):
             bool: Whether the `path` matches any of the defined exclusions.
         """
 
-        # Iterate over the exclusion regexes and attempt to match each of them
-        # to the `path`. Should any match be found the path should be excluded
-        # and `True` is returned.
-        for exclusion in self.exclude:
-            match = re.match(exclusion, path)
-            if match is not None:
-                return True
+        # Attempt to match the compiled exclusion regexes to the `path`.
+        # Should any match be found the path should be excluded and `True` is
+        # returned.
+        if self._exclude_compiled is None:
+            return False
 
-        return False
+        return self._exclude_compiled.match(path) is not None
 
     def _get_token(
         self,
@@ -137,11 +399,13 @@ class MiddlewareAuth0(object):
                 description=msg_fmt,
             )
 
-        parts = auth.split()
+        # Split the `Authorization` header into the scheme and the token.
+        scheme, _, token = auth.strip().partition(" ")
+        token = token.strip()
 
         # Perform basic structural checks on the content of the `Authorization`
         # header and raise a 401 is any of them fail.
-        if parts[0].lower() != "bearer":
+        if scheme.lower() != "bearer":
             msg_fmt = "'Authorization' header does not start with `Bearer`."
             self.logger.error(msg_fmt)
 
@@ -150,7 +414,7 @@ class MiddlewareAuth0(object):
                 title="Invalid 'Authorization' header.",
                 description=msg_fmt,
             )
-        elif len(parts) == 1:
+        elif not token:
             msg_fmt = "No token found in 'Authorization' header."
             self.logger.error(msg_fmt)
 
@@ -159,7 +423,7 @@ class MiddlewareAuth0(object):
                 title="Invalid 'Authorization' header.",
                 description=msg_fmt,
             )
-        elif len(parts) > 2:
+        elif " " in token:
             msg_fmt = ("'Authorization' header must follow a 'Bearer "
                        "<token>' format.")
             self.logger.error(msg_fmt)
@@ -170,10 +434,53 @@ class MiddlewareAuth0(object):
                 description=msg_fmt,
             )
 
-        token = parts[1]
-
         return token
 
+    def _get_unverified_header(self, token: str) -> Dict:
+        """ Decodes the header of a token without verifying the token or
+            raises a 401 error if the token is malformed.
+
+        Note:
+            Tokens without the three segments of a JWS compact serialization
+            are rejected before any decoding is attempted.
+
+        Args:
+            token (str): The token.
+
+        Returns:
+            Dict: The decoded token header.
+        """
+
+        segments = token.split(".")
+
+        if len(segments) != 3:
+            msg_fmt = "'Authorization' token is malformed."
+            self.logger.error(msg_fmt)
+
+            raise falcon.HTTPError(
+                status=falcon.HTTP_401,
+                title="Malformed 'Authorization' token.",
+                description=msg_fmt,
+            )
+
+        try:
+            header = orjson.loads(
+                base64url_decode(segments[0].encode("utf-8"))
+            )
+            if not isinstance(header, dict):
+                raise ValueError("Token header is not a JSON object.")
+        except Exception:
+            msg_fmt = "'Authorization' token is malformed."
+            self.logger.exception(msg_fmt)
+
+            raise falcon.HTTPError(
+                status=falcon.HTTP_401,
+                title="Malformed 'Authorization' token.",
+                description=msg_fmt,
+            )
+
+        return header
+
     def process_request(
         self,
         req: falcon.Request,
@@ -190,12 +497,6 @@ class MiddlewareAuth0(object):
             resp (falcon.Response): The Falcon `Response` object.
         """
 
-        # Skip the authentication check if the current request is a CORS
-        # OPTIONS request. The actual handling of the request will be handled
-        # via the `MiddlewareCors` class.
-        if MiddlewareCors.is_req_cors(req=req):
-            return None
-
         # Skip the authentication check if the current path has been excluded.
         if self._is_path_excluded(req.path):
             return None
@@ -205,29 +506,10 @@ class MiddlewareAuth0(object):
 
         # Retrieve the token header and raise a 401 if the token is malformed
         # and the header can't be retrieved.
-        try:
-            unverified_header = jwt.get_unverified_header(token)
-        except Exception:
-            msg_fmt = "'Authorization' token is malformed."
-            self.logger.exception(msg_fmt)
-
-            raise falcon.HTTPError(
-                status=falcon.HTTP_401,
-                title="Malformed 'Authorization' token.",
-                description=msg_fmt,
-            )
+        unverified_header = self._get_unverified_header(token=token)
 
-        # Assemble the RSA key.
-        rsa_key = {}
-        for key in self.jwks["keys"]:
-            if key["kid"] == unverified_header["kid"]:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"]
-                }
+        # Retrieve the RSA key matching the token key ID.
+        rsa_key = self._get_rsa_key(kid=unverified_header.get("kid"))
 
         # Validate and decode the access token and raise a 401 should it fail.
         if rsa_key:
@@ -237,7 +519,7 @@ class MiddlewareAuth0(object):
                     rsa_key,
                     algorithms=self.ALGORITHMS,
                     audience=self.auth0_audience,
-                    issuer="https://{}/".format(self.auth0_domain)
+                    issuer=self.issuer,
                 )
             except jwt.ExpiredSignatureError:
                 msg_fmt = "'Authorization' token has expired."
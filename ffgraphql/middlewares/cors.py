@@ -5,6 +5,8 @@ This module defines a `MiddlewareCors` class meant to act as a middleware that
 handles CORS OPTIONS preflight requests.
 """
 
+from typing import List
+
 import falcon
 
 from ffgraphql.loggers import create_logger
@@ -13,8 +15,39 @@ from ffgraphql.loggers import create_logger
 class MiddlewareCors(object):
     """ Falcon middleware class handling CORS OPTIONS preflight requests."""
 
-    def __init__(self, **kwargs):
-        """ Constructor."""
+    def __init__(
+        self,
+        router: falcon.routing.CompiledRouter,
+        allow_origin: str = "*",
+        max_age: int = 86400,
+        **kwargs
+    ):
+        """ Constructor.
+
+        Args:
+            router (falcon.routing.CompiledRouter): The router of the API
+                through which the resources of CORS OPTIONS preflight requests
+                are looked up.
+            allow_origin (str): The value of the `Access-Control-Allow-Origin`
+                header set on responses to cross-origin requests. Defaults to
+                `*`.
+            max_age (int): The number of seconds the results of a CORS OPTIONS
+                preflight request can be cached for. Defaults to `86400`.
+        """
+
+        # Internalize arguments.
+        self._router = router
+        self._allow_origin = allow_origin
+
+        # Precompute the headers of responses to CORS OPTIONS preflight
+        # requests.
+        self._headers_preflight = {
+            "Access-Control-Allow-Origin": allow_origin,
+            "Access-Control-Max-Age": str(max_age),
+        }
+
+        # Cache of the methods allowed on each resource class.
+        self._allow_methods_by_type = {}
 
         # Create a class-level logger.
         self.logger = create_logger(
@@ -31,66 +64,124 @@ class MiddlewareCors(object):
             req (falcon.Request): The Falcon `Request` object.
 
         Returns:
-            bool: Whether the given request is a CORS OPTIONS preflight request.
+            bool: Whether the given request is a CORS OPTIONS preflight
+                request.
         """
 
-        # If the request method is not OPTIONS then this isn't a CORS OPTIONS
-        # preflight request.
-        if req.method != "OPTIONS":
-            return False
+        # A request is a CORS OPTIONS preflight request only if the request
+        # method is OPTIONS and it specifies a `Access-Control-Request-Method`
+        # header.
+        return bool(
+            req.method == "OPTIONS" and
+            req.get_header("Access-Control-Request-Method")
+        )
 
-        # If the request does not specify a `Access-Control-Request-Method`
-        # header then this isn't a CORS OPTIONS preflight request.
-        if not req.get_header("Access-Control-Request-Method"):
-            return False
+    def _get_allow_methods(self, resource: object) -> List[str]:
+        """ Retrieves the methods allowed on a resource, i.e., those for which
+            the resource defines a responder, and `OPTIONS`.
 
-        return True
+        Args:
+            resource (object): The resource.
 
-    def process_response(
+        Returns:
+            List[str]: The allowed methods.
+        """
+
+        type_resource = type(resource)
+        allow_methods = self._allow_methods_by_type.get(type_resource)
+        if allow_methods is None:
+            allow_methods = [
+                method for method in falcon.HTTP_METHODS
+                if method == "OPTIONS" or
+                hasattr(resource, "on_{}".format(method.lower()))
+            ]
+            self._allow_methods_by_type[type_resource] = allow_methods
+
+        return allow_methods
+
+    def process_request(
         self,
         req: falcon.Request,
         resp: falcon.Response,
-        resource: object,
-        req_succeeded: bool,
     ):
-        """ Intercepts outgoing responses and handles incoming CORS OPTIONS
-            preflight requests.
+        """ Intercepts incoming requests and responds to CORS OPTIONS
+            preflight requests without routing them.
+
+        Note:
+            Preflight requests are marked as complete so that neither the
+            subsequent middlewares, e.g., the Auth0 middleware, nor the
+            responders process them. Preflight requests to paths without a
+            route or for methods the resource doesn't respond to are rejected
+            with a 404 or 405 respectively.
 
         Args:
             req (falcon.Request): The Falcon `Request` object.
             resp (falcon.Response): The Falcon `Response` object.
-            resource (object): Resource object to which the request was routed.
-                May be None if no route was found for the request.
-            req_succeeded (bool): True if no exceptions were raised while the
-                framework processed and routed the request; otherwise False.
         """
 
-        # Set the `Access-Control-Allow-Origin` header.
-        resp.set_header('Access-Control-Allow-Origin', '*')
-
         # Skip the request if it doesn't exhibit the characteristics of a CORS
         # OPTIONS preflight request.
         if not self.is_req_cors(req=req):
             return None
 
         msg_fmt = "Processing CORS preflight OPTIONS request."
-        self.logger.info(msg_fmt)
+        self.logger.debug(msg_fmt)
+
+        # Look up the resource of the request and derive the allowed methods
+        # out of its responders.
+        route = self._router.find(req.path, req=req)
+        if route is None:
+            raise falcon.HTTPNotFound()
+        allow_methods = self._get_allow_methods(resource=route[0])
 
-        # Retrieve and remove the `Allow` header from the response.
-        allow = resp.get_header('Allow')
-        resp.delete_header('Allow')
+        method = req.get_header("Access-Control-Request-Method").upper()
+        if method not in allow_methods:
+            raise falcon.HTTPMethodNotAllowed(allowed_methods=allow_methods)
 
-        # Retrieve the `Access-Control-Request-Headers` header from the
-        # request.
-        allow_headers = req.get_header(
-            'Access-Control-Request-Headers',
-            default='*'
+        # Set the precomputed CORS headers in the response.
+        resp.set_headers(self._headers_preflight)
+        resp.set_header(
+            name="Access-Control-Allow-Methods",
+            value=", ".join(allow_methods),
         )
 
-        # Set the appropriate CORS headers in the response.
-        resp.set_header(name="Access-Control-Allow-Methods", value=allow)
+        # Echo the `Access-Control-Request-Headers` header of the request.
         resp.set_header(
             name="Access-Control-Allow-Headers",
-            value=allow_headers,
+            value=req.get_header(
+                "Access-Control-Request-Headers",
+                default="*",
+            ),
         )
-        resp.set_header(name="Access-Control-Max-Age", value='86400')
+
+        # Short-circuit the remaining request processing.
+        resp.status = falcon.HTTP_200
+        resp.complete = True
+
+    def process_response(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+        resource: object,
+        req_succeeded: bool,
+    ):
+        """ Intercepts outgoing responses and sets the
+            `Access-Control-Allow-Origin` header on responses to cross-origin
+            requests.
+
+        Args:
+            req (falcon.Request): The Falcon `Request` object.
+            resp (falcon.Response): The Falcon `Response` object.
+            resource (object): Resource object to which the request was routed.
+                May be None if no route was found for the request.
+            req_succeeded (bool): True if no exceptions were raised while the
+                framework processed and routed the request; otherwise False.
+        """
+
+        # Skip the response if the request isn't a cross-origin request in
+        # which case no CORS headers are needed.
+        if not req.get_header("Origin"):
+            return None
+
+        # Set the `Access-Control-Allow-Origin` header.
+        resp.set_header("Access-Control-Allow-Origin", self._allow_origin)
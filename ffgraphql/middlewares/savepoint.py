@@ -0,0 +1,67 @@
+# coding=utf-8
+
+"""
+This module defines a `MiddlewareSavepoint` class meant to act as a GraphQL
+middleware that executes each root field of a mutation operation within a
+SAVEPOINT of the SQLAlchemy session so that a failing mutation only rolls back
+its own changes.
+"""
+
+from graphql.execution.base import ResolveInfo
+from promise import Promise
+from promise import is_thenable
+
+from ffgraphql.loggers import create_logger
+
+
+class MiddlewareSavepoint(object):
+    """ GraphQL middleware class executing each mutation within a SAVEPOINT of
+        the SQLAlchemy session of the context.
+    """
+
+    def __init__(self, **kwargs):
+        """ Constructor."""
+
+        # Create a class-level logger.
+        self.logger = create_logger(
+            logger_name=type(self).__name__,
+            logger_level=kwargs.get("logger_level", "DEBUG")
+        )
+
+    def resolve(self, next, root, info: ResolveInfo, **args):
+        """ Resolves a field wrapping the root fields of mutation operations
+            within a SAVEPOINT that is released should the resolution succeed
+            or rolled back should it fail.
+
+        Args:
+            next (Callable): The next resolver in the middleware chain.
+            root: The parent value of the field.
+            info (ResolveInfo): The resolution information of the field.
+            args: The arguments of the field.
+
+        Returns:
+            The resolved value of the field.
+        """
+
+        # Only wrap the root fields of mutations as any nested fields merely
+        # read the returned objects.
+        if info.operation.operation != "mutation" or len(info.path) != 1:
+            return next(root, info, **args)
+
+        savepoint = info.context.session.begin_nested()
+        try:
+            result = next(root, info, **args)
+            # Mutations are executed serially so the resolution is awaited to
+            # release the SAVEPOINT before the next mutation is executed.
+            if is_thenable(result):
+                result = Promise.resolve(result).get()
+        except Exception:
+            msg = "Rolling back mutation '{}'"
+            msg_fmt = msg.format(info.field_name)
+            self.logger.debug(msg_fmt)
+            savepoint.rollback()
+            raise
+
+        savepoint.commit()
+
+        return result
@@ -0,0 +1,60 @@
+# coding=utf-8
+
+"""
+This module defines a `MiddlewareSession` class meant to act as a middleware
+that removes the SQLAlchemy scoped-session at the end of each request so that
+its connection is returned to the pool.
+"""
+
+import falcon
+import sqlalchemy.orm
+
+from ffgraphql.loggers import create_logger
+
+
+class MiddlewareSession(object):
+    """ Falcon middleware class removing the SQLAlchemy scoped-session at the
+        end of each request.
+    """
+
+    def __init__(
+        self,
+        scoped_session: sqlalchemy.orm.scoped_session,
+        **kwargs
+    ):
+        """ Constructor.
+
+        Args:
+            scoped_session (sqlalchemy.orm.scoped_session): The SQLAlchemy
+                scoped-session used by the resources.
+        """
+
+        # Internalize arguments.
+        self.scoped_session = scoped_session
+
+        # Create a class-level logger.
+        self.logger = create_logger(
+            logger_name=type(self).__name__,
+            logger_level=kwargs.get("logger_level", "DEBUG")
+        )
+
+    def process_response(
+        self,
+        req: falcon.Request,
+        resp: falcon.Response,
+        resource: object,
+        req_succeeded: bool,
+    ):
+        """ Intercepts outgoing responses and removes the scoped-session
+            closing the current session and releasing its connection.
+
+        Args:
+            req (falcon.Request): The Falcon `Request` object.
+            resp (falcon.Response): The Falcon `Response` object.
+            resource (object): Resource object to which the request was routed.
+                May be None if no route was found for the request.
+            req_succeeded (bool): True if no exceptions were raised while the
+                framework processed and routed the request; otherwise False.
+        """
+
+        self.scoped_session.remove()
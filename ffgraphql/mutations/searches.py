@@ -7,21 +7,26 @@ import graphql
 import graphene
 import sqlalchemy.orm
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.dialects.postgresql import Insert
 from sqlalchemy.engine.result import ResultProxy
 
 from ffgraphql.types.app_primitives import ModelUserSearch
 from ffgraphql.types.app_primitives import ModelSearch
-from ffgraphql.types.app_primitives import ModelSearchDescriptor
 from ffgraphql.types.app_primitives import TypeSearch
 from ffgraphql.types.ct_primitives import TypeEnumGender
 from ffgraphql.types.ct_primitives import EnumGender
 from ffgraphql.utils import check_auth
 from ffgraphql.mutations.utils import clean_auth0_user_id
-from ffgraphql.mutations.utils import get_user
+from ffgraphql.mutations.utils import get_user_id
 from ffgraphql.mutations.utils import get_search
 from ffgraphql.mutations.utils import delete_search
+from ffgraphql.mutations.utils import merge_returned_row
 from ffgraphql.mutations.utils import delete_search_descriptors
+from ffgraphql.mutations.utils import upsert_search_descriptors
+
+
+# Mapping of the `EnumGender` member values to the members so that the members
+# are resolved through a dictionary lookup.
+members_gender = {member.value: member for member in EnumGender}
 
 
 class InputSearch(graphene.InputObjectType):
@@ -72,7 +77,7 @@ class MutationSearchUpsert(graphene.Mutation):
         """
 
         # Cleanup the Auth0 user ID.
-        auth0_user_id = clean_auth0_user_id(auth0_user_id=str(auth0_user_id))
+        auth0_user_id = clean_auth0_user_id(auth0_user_id=auth0_user_id)
 
         # Check that the requesting user is authorized to make changes to the
         # user with the given Auth0 ID.
@@ -80,69 +85,79 @@ class MutationSearchUpsert(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
-        # Retrieve the `ModelUser` record object.
-        user = get_user(session=session, auth0_user_id=auth0_user_id)
+        # Retrieve the ID of the `ModelUser` record.
+        user_id = get_user_id(session=session, auth0_user_id=auth0_user_id)
 
         # Raise an exception if the requested user could not be found.
-        if not user:
+        if not user_id:
             raise graphql.GraphQLError(
                 message=f"User with Auth0 ID '{auth0_user_id}' could not be "
                         f"found."
             )
 
-        # Upsert the `ModelSearch` record.
-        statement = insert(
-            ModelSearch,
-            values={
-                "search_uuid": search.search_uuid,
-                "title": search.title,
-                "gender": EnumGender.get_member(value=str(search.gender))
-                if search.gender else None,
-                "year_beg": search.year_beg,
-                "year_end": search.year_end,
-                "age_beg": search.age_beg,
-                "age_end": search.age_end,
+        # Assemble the values of the `ModelSearch` record skipping any
+        # optional attributes that haven't been defined.
+        values = {
+            "search_uuid": search.search_uuid,
+            "title": search.title,
+        }
+        if search.gender:
+            values["gender"] = members_gender[search.gender]
+        for key in ("year_beg", "year_end", "age_beg", "age_end"):
+            value = getattr(search, key)
+            if value is not None:
+                values[key] = value
+
+        # Upsert the `ModelSearch` record updating the search attributes
+        # should the search already exist and return the upserted row so that
+        # it needn't be re-fetched.
+        statement = insert(ModelSearch, values=values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[ModelSearch.search_uuid],
+            set_={
+                "title": statement.excluded.title,
+                "gender": statement.excluded.gender,
+                "year_beg": statement.excluded.year_beg,
+                "year_end": statement.excluded.year_end,
+                "age_beg": statement.excluded.age_beg,
+                "age_end": statement.excluded.age_end,
             }
-        ).on_conflict_do_nothing()  # type: Insert
-        # Execute the upsert.
-        session.execute(statement)  # type: ResultProxy
-
-        # Retrieve the newly upserted `ModelSearch` record object.
-        search = get_search(session=session, search_uuid=search.search_uuid)
+        ).returning(*ModelSearch.__table__.columns)
+        # Execute the upsert and map the returned row onto a `ModelSearch`
+        # record object.
+        obj = merge_returned_row(
+            session=session,
+            orm_class=ModelSearch,
+            row=session.execute(statement).first(),
+        )  # type: ModelSearch
+        search_id = obj.search_id
 
         # Upsert a `ModelUserSearch` record.
         statement = insert(
             ModelUserSearch,
             values={
-                "user_id": user.user_id,
-                "search_id": search.search_id,
+                "user_id": user_id,
+                "search_id": search_id,
             }
-        ).on_conflict_do_nothing()  # type: Insert
+        ).on_conflict_do_nothing()
         # Execute the upsert.
         session.execute(statement)  # type: ResultProxy
 
         # Delete all existing `ModelSearchDescriptor` records for the given
         # search so they can be replaced with new ones.
-        delete_search_descriptors(session=session, search_id=search.search_id)
+        delete_search_descriptors(session=session, search_id=search_id)
 
         # Upsert a `ModelSearchDescriptor` record for each of the defined
         # descriptors.
-        for mesh_descriptor_id in mesh_descriptor_ids:
-            statement = insert(
-                ModelSearchDescriptor,
-                values={
-                    "search_id": search.search_id,
-                    "descriptor_id": mesh_descriptor_id,
-                }
-            ).on_conflict_do_nothing()  # type: Insert
-            # Execute the upsert.
-            session.execute(statement)  # type: ResultProxy
-
-        session.commit()
+        upsert_search_descriptors(
+            session=session,
+            search_id=search_id,
+            descriptor_ids=mesh_descriptor_ids,
+        )
 
-        return MutationSearchUpsert(search=search)
+        return MutationSearchUpsert(search=obj)
 
 
 class MutationSearchDelete(graphene.Mutation):
@@ -178,7 +193,7 @@ class MutationSearchDelete(graphene.Mutation):
         """
 
         # Cleanup the Auth0 user ID.
-        auth0_user_id = clean_auth0_user_id(auth0_user_id=str(auth0_user_id))
+        auth0_user_id = clean_auth0_user_id(auth0_user_id=auth0_user_id)
 
         # Check that the requesting user is authorized to make changes to the
         # user with the given Auth0 ID.
@@ -186,13 +201,13 @@ class MutationSearchDelete(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
-        # Retrieve the `ModelUser` record object.
-        user = get_user(session=session, auth0_user_id=auth0_user_id)
+        # Retrieve the ID of the `ModelUser` record.
+        user_id = get_user_id(session=session, auth0_user_id=auth0_user_id)
 
         # Raise an exception if the requested user could not be found.
-        if not user:
+        if not user_id:
             raise graphql.GraphQLError(
                 message=f"User with Auth0 ID '{auth0_user_id}' could not be "
                         f"found."
@@ -212,6 +227,4 @@ class MutationSearchDelete(graphene.Mutation):
         # and `ModelSearchDescriptor` records.
         delete_search(session=session, search_id=search.search_id)
 
-        session.commit()
-
         return MutationSearchDelete(search=search)
@@ -4,6 +4,7 @@ from typing import Dict
 
 import graphql
 import graphene
+import sqlalchemy
 import sqlalchemy.orm
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.dialects.postgresql import Insert
@@ -13,12 +14,91 @@ from ffgraphql.types.app_primitives import ModelUser
 from ffgraphql.types.app_primitives import TypeUser
 from ffgraphql.types.app_primitives import ModelUserStudy
 from ffgraphql.types.app_primitives import ModelUserCitation
+from ffgraphql.types.ct_primitives import ModelStudy
+from ffgraphql.types.pubmed_primitives import ModelCitation
 from ffgraphql.utils import check_auth
 from ffgraphql.mutations.utils import clean_auth0_user_id
-from ffgraphql.mutations.utils import get_user
-from ffgraphql.mutations.utils import get_study
-from ffgraphql.mutations.utils import get_citation
 from ffgraphql.mutations.utils import delete_user_searches
+from ffgraphql.mutations.utils import execute_cached
+from ffgraphql.mutations.utils import merge_returned_row
+
+
+# The statements of the mutations are built once upon import with bound
+# parameters and executed with the parameters of each mutation so that they're
+# neither rebuilt nor, where executed via `execute_cached`, recompiled.
+
+# Upserts a `ModelUser` record returning the upserted row so that it needn't
+# be re-fetched. The statement is executed via `execute_cached` as the ORM
+# cannot map an `INSERT` through `Query.from_statement`.
+statement_user_upsert = insert(
+    ModelUser,
+    values={
+        "auth0_user_id": sqlalchemy.bindparam("auth0_user_id"),
+        "email": sqlalchemy.bindparam("email"),
+    }
+)  # type: Insert
+statement_user_upsert = statement_user_upsert.on_conflict_do_update(
+    index_elements=[ModelUser.auth0_user_id],
+    set_={"email": statement_user_upsert.excluded.email},
+).returning(*ModelUser.__table__.columns)  # type: Insert
+
+# Upserts a `ModelUserStudy` record selecting the user and study IDs within the
+# same statement.
+statement_user_study_upsert = insert(ModelUserStudy).from_select(
+    ["user_id", "study_id"],
+    sqlalchemy.select([ModelUser.user_id, ModelStudy.study_id]).where(
+        sqlalchemy.and_(
+            ModelUser.auth0_user_id == sqlalchemy.bindparam("auth0_user_id"),
+            ModelStudy.nct_id == sqlalchemy.bindparam("nct_id"),
+        )
+    ),
+).on_conflict_do_nothing()  # type: Insert
+
+# Upserts a `ModelUserCitation` record selecting the user and citation IDs
+# within the same statement.
+statement_user_citation_upsert = insert(ModelUserCitation).from_select(
+    ["user_id", "citation_id"],
+    sqlalchemy.select([ModelUser.user_id, ModelCitation.citation_id]).where(
+        sqlalchemy.and_(
+            ModelUser.auth0_user_id == sqlalchemy.bindparam("auth0_user_id"),
+            ModelCitation.pmid == sqlalchemy.bindparam("pmid"),
+        )
+    ),
+).on_conflict_do_nothing()  # type: Insert
+
+# Deletes a `ModelUserStudy` record selecting the user and study IDs within the
+# same statement.
+statement_user_study_delete = sqlalchemy.delete(ModelUserStudy).where(
+    sqlalchemy.and_(
+        ModelUserStudy.user_id == sqlalchemy.select(
+            [ModelUser.user_id]
+        ).where(
+            ModelUser.auth0_user_id == sqlalchemy.bindparam("auth0_user_id"),
+        ).as_scalar(),
+        ModelUserStudy.study_id == sqlalchemy.select(
+            [ModelStudy.study_id]
+        ).where(
+            ModelStudy.nct_id == sqlalchemy.bindparam("nct_id"),
+        ).as_scalar(),
+    )
+)
+
+# Deletes a `ModelUserCitation` record selecting the user and citation IDs
+# within the same statement.
+statement_user_citation_delete = sqlalchemy.delete(ModelUserCitation).where(
+    sqlalchemy.and_(
+        ModelUserCitation.user_id == sqlalchemy.select(
+            [ModelUser.user_id]
+        ).where(
+            ModelUser.auth0_user_id == sqlalchemy.bindparam("auth0_user_id"),
+        ).as_scalar(),
+        ModelUserCitation.citation_id == sqlalchemy.select(
+            [ModelCitation.citation_id]
+        ).where(
+            ModelCitation.pmid == sqlalchemy.bindparam("pmid"),
+        ).as_scalar(),
+    )
+)
 
 
 class InputUser(graphene.InputObjectType):
@@ -72,7 +152,7 @@ class MutationUserUpsert(graphene.Mutation):
 
         # Cleanup the Auth0 user ID.
         auth0_user_id = clean_auth0_user_id(
-            auth0_user_id=str(user.auth0_user_id),
+            auth0_user_id=user.auth0_user_id,
         )
 
         # Check that the requesting user is authorized to upsert the user with
@@ -81,24 +161,26 @@ class MutationUserUpsert(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
-
-        # Upsert the `ModelUser` record.
-        statement = insert(
-            ModelUser,
-            values={
-                "auth0_user_id": user.auth0_user_id,
-                "email": user.email,
-            }
-        ).on_conflict_do_nothing()  # type: Insert
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Execute the upsert.
-        result = session.execute(statement)  # type: ResultProxy
-
-        # Retrieve the newly upserted `ModelUser` record object.
-        obj = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        session.commit()
+        result = execute_cached(
+            session=session,
+            statement=statement_user_upsert,
+            params={"auth0_user_id": auth0_user_id, "email": user.email},
+        )  # type: ResultProxy
+        row = result.first()
+
+        # Map the returned row onto a `ModelUser` record object.
+        obj = merge_returned_row(
+            session=session,
+            orm_class=ModelUser,
+            row=row,
+        )  # type: ModelUser
+
+        # Prime the request data-loader with the upserted record object.
+        loader_user = info.context.loaders["user"]
+        loader_user.clear(auth0_user_id).prime(auth0_user_id, obj)
 
         return MutationUserUpsert(user=obj)
 
@@ -126,7 +208,7 @@ class MutationUserDelete(graphene.Mutation):
         """
 
         # Cleanup the Auth0 user ID.
-        auth0_user_id = clean_auth0_user_id(auth0_user_id=str(auth0_user_id))
+        auth0_user_id = clean_auth0_user_id(auth0_user_id=auth0_user_id)
 
         # Check that the requesting user is authorized to upsert the user with
         # the given Auth0 ID.
@@ -134,7 +216,7 @@ class MutationUserDelete(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Retrieve the `ModelUser` record object.
         query = session.query(ModelUser)
@@ -162,9 +244,17 @@ class MutationUserDelete(graphene.Mutation):
         query = query.filter(ModelUserCitation.user_id == obj.user_id)
         query.delete()
 
-        # Delete the `ModelUser` record.
-        session.delete(obj)
-        session.commit()
+        # Delete the `ModelUser` record via a bulk `DELETE` as opposed to
+        # `session.delete` which loads the related collections of the record
+        # in order to cascade the deletion. The record object is detached from
+        # the session and returned as is.
+        query = session.query(ModelUser)
+        query = query.filter(ModelUser.user_id == obj.user_id)
+        query.delete(synchronize_session="evaluate")
+
+        # Evict the record object of the deleted user from the request
+        # data-loader.
+        info.context.loaders["user"].clear(auth0_user_id)
 
         return MutationUserDelete(user=obj)
 
@@ -193,11 +283,11 @@ class MutationUserStudyUpsert(graphene.Mutation):
 
         # Cleanup the Auth0 user ID.
         auth0_user_id = clean_auth0_user_id(
-            auth0_user_id=str(user_study.auth0_user_id),
+            auth0_user_id=user_study.auth0_user_id,
         )
 
         # Retrieve the NCT ID of the defined study.
-        nct_id = str(user_study.nct_id)
+        nct_id = user_study.nct_id
 
         # Check that the requesting user is authorized to upsert the user with
         # the given Auth0 ID.
@@ -205,42 +295,50 @@ class MutationUserStudyUpsert(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
-
-        # Retrieve the `ModelUser` record object.
-        user = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        # Raise an exception if the requested user could not be found.
-        if not user:
-            msg = "User with Auth0 ID '{}' could not be found."
-            msg_fmt = msg.format(auth0_user_id)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Retrieve the `ModelStudy` record object.
-        study = get_study(session=session, nct_id=nct_id)
-
-        # Raise an exception if the requested study could not be found.
-        if not study:
-            msg = "Study with NCT ID '{}' could not be found."
-            msg_fmt = msg.format(nct_id)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Upsert the `ModelUserStudy` record.
-        statement = insert(
-            ModelUserStudy,
-            values={
-                "user_id": user.user_id,
-                "study_id": study.study_id,
-            }
-        ).on_conflict_do_nothing()  # type: Insert
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Execute the upsert.
-        result = session.execute(statement)  # type: ResultProxy
-
-        # Retrieve the newly upserted `ModelUser` record object.
-        obj = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        session.commit()
+        result = execute_cached(
+            session=session,
+            statement=statement_user_study_upsert,
+            params={"auth0_user_id": auth0_user_id, "nct_id": nct_id},
+        )  # type: ResultProxy
+
+        # Should no record have been inserted then either the record already
+        # exists or the user or study could not be found in which case an
+        # exception is raised.
+        if not result.rowcount:
+            query = session.query(
+                session.query(ModelUser).filter(
+                    ModelUser.auth0_user_id == auth0_user_id,
+                ).exists(),
+                session.query(ModelStudy).filter(
+                    ModelStudy.nct_id == nct_id,
+                ).exists(),
+            )
+            user_exists, study_exists = query.one()
+
+            # Raise an exception if the requested user could not be found.
+            if not user_exists:
+                msg = "User with Auth0 ID '{}' could not be found."
+                msg_fmt = msg.format(auth0_user_id)
+                raise graphql.GraphQLError(message=msg_fmt)
+
+            # Raise an exception if the requested study could not be found.
+            if not study_exists:
+                msg = "Study with NCT ID '{}' could not be found."
+                msg_fmt = msg.format(nct_id)
+                raise graphql.GraphQLError(message=msg_fmt)
+
+        # Retrieve the `ModelUser` record object through the request
+        # data-loader so that lookups are batched and cached across the
+        # mutations of a request.
+        loader_user = info.context.loaders["user"]
+        obj = loader_user.load(auth0_user_id).get()
+
+        # Expire the relationships of the cached `ModelUser` record object so
+        # that they're reloaded reflecting the executed statement.
+        session.expire(obj, ["studies", "citations"])
 
         return MutationUserStudyUpsert(user=obj)
 
@@ -270,11 +368,11 @@ class MutationUserCitationUpsert(graphene.Mutation):
 
         # Cleanup the Auth0 user ID.
         auth0_user_id = clean_auth0_user_id(
-            auth0_user_id=str(user_citation.auth0_user_id),
+            auth0_user_id=user_citation.auth0_user_id,
         )
 
         # Retrieve the PubMed ID of the defined citation.
-        pmid = int(str(user_citation.pmid))
+        pmid = user_citation.pmid
 
         # Check that the requesting user is authorized to upsert the user with
         # the given Auth0 ID.
@@ -282,42 +380,50 @@ class MutationUserCitationUpsert(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
-
-        # Retrieve the `ModelUser` record object.
-        user = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        # Raise an exception if the requested user could not be found.
-        if not user:
-            msg = "User with Auth0 ID '{}' could not be found."
-            msg_fmt = msg.format(auth0_user_id)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Retrieve the `ModelCitation` record object.
-        citation = get_citation(session=session, pmid=pmid)
-
-        # Raise an exception if the requested citation could not be found.
-        if not citation:
-            msg = "Citation with PubMed ID '{}' could not be found."
-            msg_fmt = msg.format(pmid)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Upsert the `ModelUserStudy` record.
-        statement = insert(
-            ModelUserCitation,
-            values={
-                "user_id": user.user_id,
-                "citation_id": citation.citation_id,
-            }
-        ).on_conflict_do_nothing()  # type: Insert
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Execute the upsert.
-        result = session.execute(statement)  # type: ResultProxy
-
-        # Retrieve the newly upserted `ModelCitation` record object.
-        obj = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        session.commit()
+        result = execute_cached(
+            session=session,
+            statement=statement_user_citation_upsert,
+            params={"auth0_user_id": auth0_user_id, "pmid": pmid},
+        )  # type: ResultProxy
+
+        # Should no record have been inserted then either the record already
+        # exists or the user or citation could not be found in which case an
+        # exception is raised.
+        if not result.rowcount:
+            query = session.query(
+                session.query(ModelUser).filter(
+                    ModelUser.auth0_user_id == auth0_user_id,
+                ).exists(),
+                session.query(ModelCitation).filter(
+                    ModelCitation.pmid == pmid,
+                ).exists(),
+            )
+            user_exists, citation_exists = query.one()
+
+            # Raise an exception if the requested user could not be found.
+            if not user_exists:
+                msg = "User with Auth0 ID '{}' could not be found."
+                msg_fmt = msg.format(auth0_user_id)
+                raise graphql.GraphQLError(message=msg_fmt)
+
+            # Raise an exception if the requested citation could not be found.
+            if not citation_exists:
+                msg = "Citation with PubMed ID '{}' could not be found."
+                msg_fmt = msg.format(pmid)
+                raise graphql.GraphQLError(message=msg_fmt)
+
+        # Retrieve the `ModelUser` record object through the request
+        # data-loader so that lookups are batched and cached across the
+        # mutations of a request.
+        loader_user = info.context.loaders["user"]
+        obj = loader_user.load(auth0_user_id).get()
+
+        # Expire the relationships of the cached `ModelUser` record object so
+        # that they're reloaded reflecting the executed statement.
+        session.expire(obj, ["studies", "citations"])
 
         return MutationUserCitationUpsert(user=obj)
 
@@ -346,11 +452,11 @@ class MutationUserStudyDelete(graphene.Mutation):
 
         # Cleanup the Auth0 user ID.
         auth0_user_id = clean_auth0_user_id(
-            auth0_user_id=str(user_study.auth0_user_id),
+            auth0_user_id=user_study.auth0_user_id,
         )
 
         # Retrieve the NCT ID of the defined study.
-        nct_id = str(user_study.nct_id)
+        nct_id = user_study.nct_id
 
         # Check that the requesting user is authorized to upsert the user with
         # the given Auth0 ID.
@@ -358,46 +464,54 @@ class MutationUserStudyDelete(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
-
-        # Retrieve the `ModelUser` record object.
-        user = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        # Raise an exception if the requested user could not be found.
-        if not user:
-            msg = "User with Auth0 ID '{}' could not be found."
-            msg_fmt = msg.format(auth0_user_id)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Retrieve the `ModelStudy` record object.
-        study = get_study(session=session, nct_id=nct_id)
-
-        # Raise an exception if the requested study could not be found.
-        if not study:
-            msg = "Study with NCT ID '{}' could not be found."
-            msg_fmt = msg.format(nct_id)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Retrieve the `ModelUserStudy` record object.
-        query = session.query(ModelUserStudy)
-        query = query.filter(ModelUserStudy.user_id == user.user_id)
-        query = query.filter(ModelUserStudy.study_id == study.study_id)
-        user_study = query.one_or_none()
+        session = info.context.session  # type: sqlalchemy.orm.Session
+
+        # Execute the deletion.
+        result = execute_cached(
+            session=session,
+            statement=statement_user_study_delete,
+            params={"auth0_user_id": auth0_user_id, "nct_id": nct_id},
+        )  # type: ResultProxy
+
+        # Should no record have been deleted then raise an exception stating
+        # whether the user, study, or user-study could not be found.
+        if not result.rowcount:
+            query = session.query(
+                session.query(ModelUser).filter(
+                    ModelUser.auth0_user_id == auth0_user_id,
+                ).exists(),
+                session.query(ModelStudy).filter(
+                    ModelStudy.nct_id == nct_id,
+                ).exists(),
+            )
+            user_exists, study_exists = query.one()
+
+            # Raise an exception if the requested user could not be found.
+            if not user_exists:
+                msg = "User with Auth0 ID '{}' could not be found."
+                msg_fmt = msg.format(auth0_user_id)
+                raise graphql.GraphQLError(message=msg_fmt)
+
+            # Raise an exception if the requested study could not be found.
+            if not study_exists:
+                msg = "Study with NCT ID '{}' could not be found."
+                msg_fmt = msg.format(nct_id)
+                raise graphql.GraphQLError(message=msg_fmt)
 
-        # Raise an exception if the requested user-study could not be found.
-        if not user_study:
             msg = ("User-study for user with Auth0 ID '{} and NCT ID '{}' "
                    "could not be found.")
             msg_fmt = msg.format(auth0_user_id, nct_id)
             raise graphql.GraphQLError(message=msg_fmt)
 
-        # Delete the `ModelUserStudy` record.
-        session.delete(user_study)
+        # Retrieve the `ModelUser` record object through the request
+        # data-loader so that lookups are batched and cached across the
+        # mutations of a request.
+        loader_user = info.context.loaders["user"]
+        obj = loader_user.load(auth0_user_id).get()
 
-        # Retrieve the newly upserted `ModelUser` record object.
-        obj = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        session.commit()
+        # Expire the relationships of the cached `ModelUser` record object so
+        # that they're reloaded reflecting the executed statement.
+        session.expire(obj, ["studies", "citations"])
 
         return MutationUserStudyDelete(user=obj)
 
@@ -427,11 +541,11 @@ class MutationUserCitationDelete(graphene.Mutation):
 
         # Cleanup the Auth0 user ID.
         auth0_user_id = clean_auth0_user_id(
-            auth0_user_id=str(user_citation.auth0_user_id),
+            auth0_user_id=user_citation.auth0_user_id,
         )
 
         # Retrieve the PubMed ID of the defined study.
-        pmid = int(str(user_citation.pmid))
+        pmid = user_citation.pmid
 
         # Check that the requesting user is authorized to upsert the user with
         # the given Auth0 ID.
@@ -439,47 +553,53 @@ class MutationUserCitationDelete(graphene.Mutation):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
-
-        # Retrieve the `ModelUser` record object.
-        user = get_user(session=session, auth0_user_id=auth0_user_id)
-
-        # Raise an exception if the requested user could not be found.
-        if not user:
-            msg = "User with Auth0 ID '{}' could not be found."
-            msg_fmt = msg.format(auth0_user_id)
-            raise graphql.GraphQLError(message=msg_fmt)
+        session = info.context.session  # type: sqlalchemy.orm.Session
+
+        # Execute the deletion.
+        result = execute_cached(
+            session=session,
+            statement=statement_user_citation_delete,
+            params={"auth0_user_id": auth0_user_id, "pmid": pmid},
+        )  # type: ResultProxy
+
+        # Should no record have been deleted then raise an exception stating
+        # whether the user, citation, or user-citation could not be found.
+        if not result.rowcount:
+            query = session.query(
+                session.query(ModelUser).filter(
+                    ModelUser.auth0_user_id == auth0_user_id,
+                ).exists(),
+                session.query(ModelCitation).filter(
+                    ModelCitation.pmid == pmid,
+                ).exists(),
+            )
+            user_exists, citation_exists = query.one()
+
+            # Raise an exception if the requested user could not be found.
+            if not user_exists:
+                msg = "User with Auth0 ID '{}' could not be found."
+                msg_fmt = msg.format(auth0_user_id)
+                raise graphql.GraphQLError(message=msg_fmt)
+
+            # Raise an exception if the requested citation could not be found.
+            if not citation_exists:
+                msg = "Citation with PubMed ID '{}' could not be found."
+                msg_fmt = msg.format(pmid)
+                raise graphql.GraphQLError(message=msg_fmt)
 
-        # Retrieve the `ModelCitation` record object.
-        citation = get_citation(session=session, pmid=pmid)
-
-        # Raise an exception if the requested citation could not be found.
-        if not citation:
-            msg = "Citation with PubMed ID '{}' could not be found."
-            msg_fmt = msg.format(pmid)
-            raise graphql.GraphQLError(message=msg_fmt)
-
-        # Retrieve the `ModelUserCitation` record object.
-        query = session.query(ModelUserCitation)
-        query = query.filter(ModelUserCitation.user_id == user.user_id)
-        query = query.filter(
-            ModelUserCitation.citation_id == citation.citation_id,
-        )
-        user_citation = query.one_or_none()
-
-        # Raise an exception if the requested user-citation could not be found.
-        if not user_citation:
             msg = ("User-citation for user with Auth0 ID '{} and PubMed "
                    "ID '{}' could not be found.")
             msg_fmt = msg.format(auth0_user_id, pmid)
             raise graphql.GraphQLError(message=msg_fmt)
 
-        # Delete the `ModelUserCitation` record.
-        session.delete(user_citation)
-
-        # Retrieve the newly upserted `ModelUser` record object.
-        obj = get_user(session=session, auth0_user_id=auth0_user_id)
+        # Retrieve the `ModelUser` record object through the request
+        # data-loader so that lookups are batched and cached across the
+        # mutations of a request.
+        loader_user = info.context.loaders["user"]
+        obj = loader_user.load(auth0_user_id).get()
 
-        session.commit()
+        # Expire the relationships of the cached `ModelUser` record object so
+        # that they're reloaded reflecting the executed statement.
+        session.expire(obj, ["studies", "citations"])
 
         return MutationUserCitationDelete(user=obj)
@@ -1,9 +1,13 @@
 # coding=utf-8
 
+import io
 import uuid
-from typing import Optional, List
+from typing import Dict, Optional, List
 
+import sqlalchemy
 import sqlalchemy.orm
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine.result import ResultProxy
 
 from ffgraphql.types.app_primitives import ModelUser
 from ffgraphql.types.app_primitives import ModelUserSearch
@@ -13,6 +17,75 @@ from ffgraphql.types.ct_primitives import ModelStudy
 from ffgraphql.types.pubmed_primitives import ModelCitation
 
 
+# Cache of compiled statements used by `execute_cached`. The cache only holds
+# statements built once upon import so it's bounded by their number.
+cache_compiled_statements = {}
+
+# The number of search descriptors above which the descriptors are bulk-loaded
+# via `COPY` instead of a multi-row `INSERT`.
+COPY_THRESHOLD_SEARCH_DESCRIPTORS = 500
+
+
+def execute_cached(
+    session: sqlalchemy.orm.Session,
+    statement: sqlalchemy.sql.expression.Executable,
+    params: Optional[Dict] = None,
+) -> ResultProxy:
+    """ Executes a statement within the session transaction reusing its
+        compiled form across executions.
+
+    Note:
+        Only statements built once, e.g., upon import, with bound parameters
+        should be executed through this function as the compiled statements
+        are cached by statement.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+            used to perform the interaction with the SQL database.
+        statement (sqlalchemy.sql.expression.Executable): The statement to be
+            executed.
+        params (Optional[Dict]): The values of the bound parameters of the
+            statement.
+
+    Returns:
+        ResultProxy: The result of the execution.
+    """
+
+    connection = session.connection().execution_options(
+        compiled_cache=cache_compiled_statements,
+    )
+
+    return connection.execute(statement, params or {})
+
+
+def merge_returned_row(
+    session: sqlalchemy.orm.Session,
+    orm_class: type,
+    row: sqlalchemy.engine.RowProxy,
+) -> object:
+    """ Maps a row returned by a statement, e.g., through `RETURNING`, onto a
+        record object and merges it into the session as a persistent object
+        without re-fetching it.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+            used to perform the interaction with the SQL database.
+        orm_class (type): The ORM class of the record object.
+        row (sqlalchemy.engine.RowProxy): The returned row holding all columns
+            of the ORM class.
+
+    Returns:
+        object: The merged record object.
+    """
+
+    obj = orm_class()
+    for prop in sqlalchemy.inspect(orm_class).column_attrs:
+        setattr(obj, prop.key, row[prop.columns[0]])
+    sqlalchemy.orm.make_transient_to_detached(obj)
+
+    return session.merge(obj, load=False)
+
+
 def clean_auth0_user_id(auth0_user_id: str) -> str:
     """ Cleans an Auth0 user ID by removing the `auth0|` prefix.
 
@@ -23,9 +96,9 @@ def clean_auth0_user_id(auth0_user_id: str) -> str:
         str: The cleaned up Auth0 user ID.
     """
 
-    # If the `auth0_user_id` starts with `auth0|` then remove that prefix.
+    # If the `auth0_user_id` starts with `auth0|` then strip that prefix.
     if auth0_user_id.startswith("auth0|"):
-        auth0_user_id = auth0_user_id.replace("auth0|", "")
+        auth0_user_id = auth0_user_id[len("auth0|"):]
 
     return auth0_user_id
 
@@ -54,6 +127,38 @@ def get_user(
     return obj
 
 
+def get_user_id(
+    session: sqlalchemy.orm.Session,
+    auth0_user_id: str,
+) -> Optional[int]:
+    """ Retrieves the ID of a `ModelUser` record via its Auth0 user ID.
+
+    Note:
+        The ID is deliberately not cached across requests as a user may be
+        deleted or re-created through another worker process in which case a
+        cached ID would attach records to a stale user.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+            used to perform the interaction with the SQL database.
+        auth0_user_id (str): The Auth0 user ID for which retrieval will be
+            performed.
+
+    Returns:
+        int: The ID of the `ModelUser` record or `None` if no matches were
+            found.
+    """
+
+    query = session.query(ModelUser.user_id)
+    query = query.filter(ModelUser.auth0_user_id == auth0_user_id)
+    result = query.one_or_none()
+
+    if result is None:
+        return None
+
+    return result[0]
+
+
 def get_search(
     session: sqlalchemy.orm.Session,
     search_uuid: uuid.UUID,
@@ -138,9 +243,83 @@ def delete_search_descriptors(
         search_id (int): The search ID for which deletion will be performed.
     """
 
+    # The identity map is not synchronized as the deleted records are not
+    # accessed afterwards.
     query = session.query(ModelSearchDescriptor)
     query = query.filter(ModelSearchDescriptor.search_id == search_id)
-    query.delete()
+    query.delete(synchronize_session=False)
+
+
+def upsert_search_descriptors(
+    session: sqlalchemy.orm.Session,
+    search_id: int,
+    descriptor_ids: List[int],
+):
+    """ Upserts a `ModelSearchDescriptor` record for each of the given
+        descriptors under a given search.
+
+    Note:
+        Up to `COPY_THRESHOLD_SEARCH_DESCRIPTORS` descriptors are upserted
+        via a single multi-row `INSERT`. Above that the descriptors are
+        bulk-loaded into a temporary table via `COPY` and upserted from there
+        via a single `INSERT ... SELECT`.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+            used to perform the interaction with the SQL database.
+        search_id (int): The search ID for which the upsert will be performed.
+        descriptor_ids (List[int]): The descriptor IDs to be upserted.
+    """
+
+    if not descriptor_ids:
+        return None
+
+    if len(descriptor_ids) <= COPY_THRESHOLD_SEARCH_DESCRIPTORS:
+        statement = insert(
+            ModelSearchDescriptor,
+            values=[
+                {
+                    "search_id": search_id,
+                    "descriptor_id": descriptor_id,
+                } for descriptor_id in descriptor_ids
+            ]
+        ).on_conflict_do_nothing()
+        session.execute(statement)
+        return None
+
+    # Create a temporary table on the session connection and bulk-load the
+    # search descriptors into it via `COPY`.
+    table_tmp = sqlalchemy.table(
+        "tmp_search_descriptors",
+        sqlalchemy.column("search_id"),
+        sqlalchemy.column("descriptor_id"),
+    )
+    session.execute(
+        "CREATE TEMPORARY TABLE tmp_search_descriptors "
+        "(search_id BIGINT, descriptor_id BIGINT) ON COMMIT DROP"
+    )
+
+    buffer = io.StringIO("".join(
+        "{}\t{}\n".format(search_id, descriptor_id)
+        for descriptor_id in descriptor_ids
+    ))
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            "COPY tmp_search_descriptors (search_id, descriptor_id) "
+            "FROM STDIN",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+    # Upsert the search descriptors out of the temporary table and drop it.
+    statement = insert(ModelSearchDescriptor).from_select(
+        ["search_id", "descriptor_id"],
+        sqlalchemy.select([table_tmp.c.search_id, table_tmp.c.descriptor_id]),
+    ).on_conflict_do_nothing()
+    session.execute(statement)
+    session.execute("DROP TABLE tmp_search_descriptors")
 
 
 def delete_search(
@@ -162,12 +341,12 @@ def delete_search(
     # Delete `ModelUserSearch` record.
     query = session.query(ModelUserSearch)
     query = query.filter(ModelUserSearch.search_id == search_id)
-    query.delete()
+    query.delete(synchronize_session=False)
 
     # Delete `ModelSearch` record.
     query = session.query(ModelSearch)
     query = query.filter(ModelSearch.search_id == search_id)
-    query.delete()
+    query.delete(synchronize_session=False)
 
 
 def delete_user_searches(
@@ -183,12 +362,27 @@ def delete_user_searches(
         user_id (int): The user ID for which deletion will be performed.
     """
 
-    # Retrieve all `ModelUserSearch` records for that user.
-    query = session.query(ModelUserSearch)
-    query = query.filter(ModelUserSearch.user_id == user_id)
-    user_searches = query.all()  # type: List[ModelUserSearch]
+    # Select the IDs of the searches of that user.
+    search_ids = sqlalchemy.select([ModelUserSearch.search_id]).where(
+        ModelUserSearch.user_id == user_id,
+    )
+
+    # Delete all related `ModelSearchDescriptor` records.
+    query = session.query(ModelSearchDescriptor)
+    query = query.filter(ModelSearchDescriptor.search_id.in_(search_ids))
+    query.delete(synchronize_session=False)
+
+    # Delete the `ModelUserSearch` records returning the IDs of the related
+    # searches.
+    statement = sqlalchemy.delete(ModelUserSearch).where(
+        ModelUserSearch.user_id == user_id,
+    ).returning(ModelUserSearch.search_id)
+    search_ids = [row[0] for row in session.execute(statement)]
 
-    # Iterate over the retrieved `ModelUserSearch` records and delete them
-    # along with their related records.
-    for user_search in user_searches:
-        delete_search(session=session, search_id=user_search.search_id)
+    if not search_ids:
+        return None
+
+    # Delete the related `ModelSearch` records.
+    query = session.query(ModelSearch)
+    query = query.filter(ModelSearch.search_id.in_(search_ids))
+    query.delete(synchronize_session=False)
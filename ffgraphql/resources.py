@@ -1,20 +1,81 @@
 # coding=utf-8
 
-import json
-import functools
-from collections import OrderedDict
-from typing import Dict
+import logging
+from typing import Dict, Optional
 
 import attrdict
 import graphene
 import falcon
+import orjson
+from graphql.execution import ExecutionResult
+from graphql.language.ast import Document
+from graphql.language.ast import Field
+from graphql.language.ast import OperationDefinition
 
 from ffgraphql.loggers import create_logger
+from ffgraphql.backends import GraphQlBackendCached
+from ffgraphql.caches import CacheLru
+from ffgraphql.loaders import create_loaders
+from ffgraphql.context import ContextGraphQl
+from ffgraphql.middlewares.savepoint import MiddlewareSavepoint
+
+
+# Options passed to `orjson` when serializing response bodies. Naive datetime
+# objects are treated as UTC and UTC datetime objects are serialized with a `Z`
+# suffix.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def serialize_error(message: str) -> bytes:
+    """ Serializes a GraphQL error response body holding a single error.
+
+    Args:
+        message (str): The message of the error.
+
+    Returns:
+        bytes: The serialized response body.
+    """
+
+    return orjson.dumps(
+        {"errors": [{"message": message}]},
+        option=ORJSON_OPTIONS,
+    )
 
 
 class ResourceGraphQl(object):
     """Main GraphQL server. Integrates with the predefined Graphene schema."""
 
+    # Root query fields serving read-only data that isn't specific to the
+    # requesting user mapped to the names of their cacheable sub-fields or
+    # `None` if all sub-fields are cacheable. Queries selecting only these
+    # fields have their results cached. Citation searches are excluded as
+    # their results are unbounded and streamed.
+    FIELDS_CACHEABLE = {
+        "studiesStats": None,
+        "citations": frozenset(["byId", "byPmid"]),
+        "citationsStats": None,
+        "descriptors": None,
+        "healthTopicGroups": None,
+        "bodyParts": None,
+    }
+
+    # The statuses and bodies of the error responses keyed by the kind of
+    # error. The bodies are serialized once as they never change.
+    ERRORS = {
+        "no_query": (
+            falcon.HTTP_400,
+            serialize_error(message="Must provide query string."),
+        ),
+        "invalid_variables": (
+            falcon.HTTP_400,
+            serialize_error(message="Variables are invalid JSON."),
+        ),
+        "invalid_body": (
+            falcon.HTTP_400,
+            serialize_error(message="POST body sent invalid JSON."),
+        ),
+    }
+
     def __init__(
         self,
         cfg: attrdict.AttrDict,
@@ -31,24 +92,138 @@ class ResourceGraphQl(object):
             logger_level="DEBUG"
         )
 
-        self._respond_no_query = functools.partial(
-            self._respond_error,
-            status=falcon.HTTP_400,
-            message="Must provide query string.",
-        )
+        # Create a GraphQL backend caching the parsed and validated documents
+        # so that repeated queries skip parsing and validation.
+        self.backend = GraphQlBackendCached()
 
-        self._respond_invalid_variables = functools.partial(
-            self._respond_error,
-            status=falcon.HTTP_400,
-            message="Variables are invalid JSON.",
-        )
+        # Create a cache of the results of read-only queries.
+        self.cache_results = CacheLru(maxsize=512, ttl=60)
+
+    def _execute_document(
+        self,
+        query: str,
+        variable_values,
+        context_value: ContextGraphQl,
+        operation_name=None,
+        middleware=None,
+    ) -> ExecutionResult:
+        """ Executes a GraphQL query through the cached document of the
+            backend bypassing the Graphene `execute` wrapper.
+
+        Args:
+            query (str): The GraphQL query string.
+            variable_values: The query variables.
+            context_value (ContextGraphQl): The context passed to the
+                resolvers.
+            operation_name (Optional[str]): The name of the operation to
+                execute.
+            middleware (Optional[list]): The GraphQL middlewares applied to
+                the field resolvers.
+
+        Returns:
+            ExecutionResult: The result of the execution.
+        """
+
+        # Retrieve the parsed and validated document and wrap any parsing
+        # errors in the result as the Graphene `execute` wrapper would.
+        try:
+            document = self.backend.document_from_string(
+                schema=self.schema,
+                document_string=query,
+            )
+        except Exception as exc:
+            return ExecutionResult(errors=[exc], invalid=True)
+
+        # Return the cached result of a read-only query (if any).
+        key = None
+        if self._is_document_cacheable(
+            document_ast=document.document_ast,
+            operation_name=operation_name,
+        ):
+            key = (
+                self.backend.hash_document_string(document_string=query),
+                orjson.dumps(variable_values, option=orjson.OPT_SORT_KEYS),
+                operation_name,
+            )
+            result = self.cache_results.get(key)
+            if result is not None:
+                return result
 
-        self._respond_invalid_body = functools.partial(
-            self._respond_error,
-            status=falcon.HTTP_400,
-            message="POST body sent invalid JSON.",
+        result = document.execute(
+            context_value=context_value,
+            variable_values=variable_values,
+            operation_name=operation_name,
+            middleware=middleware,
         )
 
+        # Cache the result of a read-only query unless it errored.
+        if key is not None and not result.errors:
+            self.cache_results.set(key, result)
+
+        return result
+
+    def _is_document_cacheable(
+        self,
+        document_ast: Document,
+        operation_name: Optional[str] = None,
+    ) -> bool:
+        """ Checks whether the executed operation of a GraphQL document is a
+            query selecting only root fields, and their sub-fields, under
+            `FIELDS_CACHEABLE`.
+
+        Args:
+            document_ast (Document): The parsed GraphQL document.
+            operation_name (Optional[str]): The name of the operation to
+                execute.
+
+        Returns:
+            bool: Whether the result of the operation can be cached.
+        """
+
+        operations = [
+            definition for definition in document_ast.definitions
+            if isinstance(definition, OperationDefinition)
+        ]
+
+        # Retrieve the executed operation.
+        if operation_name:
+            operations = [
+                operation for operation in operations
+                if operation.name and operation.name.value == operation_name
+            ]
+        if len(operations) != 1:
+            return False
+        operation = operations[0]
+
+        if operation.operation != "query":
+            return False
+
+        # Fragments aren't resolved so any fragment at the root level, or
+        # under a root field with restricted sub-fields, renders the operation
+        # non-cacheable.
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, Field):
+                return False
+            if selection.name.value not in self.FIELDS_CACHEABLE:
+                return False
+
+            # The document hasn't been validated yet so root fields lacking a
+            # sub-selection are left for the execution to report.
+            if selection.selection_set is None:
+                return False
+
+            names_cacheable = self.FIELDS_CACHEABLE[selection.name.value]
+            if names_cacheable is None:
+                continue
+
+            for subselection in selection.selection_set.selections:
+                if not isinstance(subselection, Field):
+                    return False
+                if subselection.name.value not in names_cacheable:
+                    return False
+
+        return True
+
     def _execute_query(
         self,
         query,
@@ -57,31 +232,28 @@ class ResourceGraphQl(object):
         token_payload: Dict,
         operation_name=None,
     ):
-        result = self.schema.execute(
-            query,
+        result = self._execute_document(
+            query=query,
             variable_values=variable_values,
             operation_name=operation_name,
-            context_value={
-                "cfg": self.cfg,
-                "token": token,
-                "token_payload": token_payload,
-            }
+            context_value=ContextGraphQl(
+                cfg=self.cfg,
+                token=token,
+                token_payload=token_payload,
+            ),
         )
 
         return result
 
-    @staticmethod
-    def _respond_error(
-        resp: falcon.Response,
-        status: str,
-        message: str,
-    ):
+    def _respond_error(self, resp: falcon.Response, kind: str):
+        """ Responds with one of the predefined error responses.
 
-        resp.status = status
-        resp.body = json.dumps(
-            {"errors": [{"message": message}]},
-            separators=(',', ':')
-        )
+        Args:
+            resp (falcon.Response): The response object.
+            kind (str): The kind of error keyed under `ERRORS`.
+        """
+
+        resp.status, resp.data = self.ERRORS[kind]
 
     def on_post(self, req, resp):
         """Handles GraphQL POST requests."""
@@ -94,10 +266,9 @@ class ResourceGraphQl(object):
 
         if 'variables' in req.params and req.params['variables']:
             try:
-                variables = json.loads(str(req.params['variables']),
-                                       object_pairs_hook=OrderedDict)
-            except json.decoder.JSONDecodeError:
-                return self._respond_invalid_variables(resp=resp)
+                variables = orjson.loads(str(req.params['variables']))
+            except orjson.JSONDecodeError:
+                return self._respond_error(resp=resp, kind="invalid_variables")
         else:
             variables = None
 
@@ -106,72 +277,75 @@ class ResourceGraphQl(object):
         else:
             operation_name = None
 
+        # Retrieve the media-type of the request stripping any parameters,
+        # e.g., `charset`, off the content-type.
+        if req.content_type:
+            media_type = req.content_type.partition(';')[0].strip().lower()
+        else:
+            media_type = None
+
         # Next, handle 'content-type: application/json' requests
-        if req.content_type and 'application/json' in req.content_type:
+        if media_type == 'application/json':
             # error for requests with no content
             if req.content_length in (None, 0):
-                return self._respond_invalid_body(resp=resp)
+                return self._respond_error(resp=resp, kind="invalid_body")
 
-            # read and decode request body
-            raw_json = req.stream.read()
+            # read the request body up to its content-length and parse it
+            # directly from bytes
+            raw_json = req.bounded_stream.read(req.content_length)
             try:
-                req.context['post_data'] = json.loads(
-                    raw_json.decode('utf-8'),
-                    object_pairs_hook=OrderedDict
-                )
-            except json.decoder.JSONDecodeError:
-                return self._respond_invalid_body(resp=resp)
+                post_data = orjson.loads(raw_json)
+            except orjson.JSONDecodeError:
+                return self._respond_error(resp=resp, kind="invalid_body")
+
+            # the body must be a JSON object
+            if not isinstance(post_data, dict):
+                return self._respond_error(resp=resp, kind="invalid_body")
+
+            req.context['post_data'] = post_data
 
             # build the query string (Graph Query Language string)
-            if (
-                query is None and req.context['post_data'] and
-                'query' in req.context['post_data']
-            ):
-                query = str(req.context['post_data']['query'])
-            elif query is None:
-                return self._respond_no_query(resp=resp)
+            if query is None:
+                query = post_data.get('query')
+                if query is None:
+                    return self._respond_error(resp=resp, kind="no_query")
 
             # build the variables string (JSON string of key/value pairs)
-            if (
-                variables is None and
-                req.context['post_data'] and
-                'variables' in req.context['post_data'] and
-                req.context['post_data']['variables']
-            ):
+            post_variables = post_data.get('variables')
+            if variables is None and post_variables:
+                # The variables are typically already parsed along with the
+                # body and only need parsing if sent as a JSON string.
+                variables = post_variables
                 try:
-                    variables = req.context['post_data']['variables']
-                    if not isinstance(variables, OrderedDict):
-                        json_str = str(req.context['post_data']['variables'])
-                        variables = json.loads(
-                            json_str,
-                            object_pairs_hook=OrderedDict
-                        )
-                except json.decoder.JSONDecodeError:
+                    if isinstance(variables, (str, bytes)):
+                        variables = orjson.loads(variables)
+                except orjson.JSONDecodeError:
                     self.logger.exception(variables)
-                    return self._respond_invalid_variables(resp=resp)
+                    return self._respond_error(
+                        resp=resp,
+                        kind="invalid_variables",
+                    )
 
             elif variables is None:
                 variables = ""
 
             # build the operationName string (matches a query or mutation name)
-            if (
-                operation_name is None and
-                'operationName' in req.context['post_data'] and
-                req.context['post_data']['operationName']
-            ):
-                operation_name = str(req.context['post_data']['operationName'])
+            if operation_name is None:
+                operation_name = post_data.get('operationName') or None
 
         # Alternately, handle 'content-type: application/graphql' requests
-        elif req.content_type and 'application/graphql' in req.content_type:
-            # read and decode request body
-            req.context['post_data'] = req.stream.read().decode('utf-8')
+        elif media_type == 'application/graphql':
+            # read and decode request body up to its content-length
+            req.context['post_data'] = req.bounded_stream.read().decode(
+                'utf-8'
+            )
 
             # build the query string
             if query is None and req.context['post_data']:
                 query = str(req.context['post_data'])
 
             elif query is None:
-                return self._respond_no_query(resp=resp)
+                return self._respond_error(resp=resp, kind="no_query")
 
         # Skip application/x-www-form-urlencoded since they are automatically
         # included by setting req_options.auto_parse_form_urlencoded = True
@@ -179,7 +353,7 @@ class ResourceGraphQl(object):
         elif query is None:
             # this means that the content-type is wrong and there aren't any
             # query params in the url
-            return self._respond_no_query(resp=resp)
+            return self._respond_error(resp=resp, kind="no_query")
 
         # redirect stdout of schema.execute to /dev/null
         result = self._execute_query(
@@ -190,43 +364,28 @@ class ResourceGraphQl(object):
             operation_name=operation_name
         )
 
-        # If the GraphQL execution resulted in errors then respond with a 200
-        # but include the error messages out of the exceptions.
+        # Build the response payload which is serialized once. If the GraphQL
+        # execution resulted in errors then respond with a 200 but include the
+        # error messages out of the exceptions. If the GraphQL execution
+        # yielded results then respond with those. Otherwise respond with a
+        # 500 error as the GraphQL execution yielded neither results nor
+        # errors.
         if result.errors:
             resp.status = falcon.HTTP_200
-            resp.body = json.dumps(
-                {
-                    "errors": [{
-                        "message": str(error)
-                    } for error in result.errors]
-                },
-                separators=(',', ':')
-            )
-            return None
-
-        # If the GraphQL execution yielded results then construct the response
-        # and return. Otherwise respond with a 500 error as the GraphQL
-        # execution yielded neither results nor errors.
-        if result.data:
+            err_list = [
+                {"message": str(error)} for error in result.errors
+            ]
+            payload = {"errors": err_list}
+        elif result.data:
             resp.status = falcon.HTTP_200
-            resp.body = json.dumps(
-                {
-                    'data': result.data
-                },
-                separators=(',', ':')
-            )
-            return None
+            payload = {"data": result.data}
         else:
             resp.status = falcon.HTTP_500
-            resp.body = json.dumps(
-                {
-                    "errors": [{
-                        "message": str(error)
-                    } for error in result.errors]
-                },
-                separators=(',', ':')
-            )
-            return None
+            payload = {"errors": []}
+
+        resp.data = orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+        return None
 
 
 class ResourceGraphQlSqlAlchemy(ResourceGraphQl):
@@ -246,6 +405,10 @@ class ResourceGraphQlSqlAlchemy(ResourceGraphQl):
             schema=schema
         )
 
+        # Create the GraphQL middleware executing each mutation within a
+        # SAVEPOINT.
+        self.middleware_savepoint = MiddlewareSavepoint()
+
     def _execute_query(
         self,
         query,
@@ -254,20 +417,36 @@ class ResourceGraphQlSqlAlchemy(ResourceGraphQl):
         token_payload: Dict,
         operation_name=None,
     ):
-        msg = "Executing query: {} with variables {}"
-        msg_fmt = msg.format(query, variable_values)
-        self.logger.debug(msg_fmt)
-
-        result = self.schema.execute(
-            query,
-            variable_values=variable_values,
-            operation_name=operation_name,
-            context_value={
-                "session": self.scoped_session,
-                "cfg": self.cfg,
-                "token": token,
-                "token_payload": token_payload,
-            }
-        )
+        # Only format the message if it's going to be emitted as the query and
+        # variables can be sizeable.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            msg = "Executing query: {} with variables {}"
+            msg_fmt = msg.format(query, variable_values)
+            self.logger.debug(msg_fmt)
+
+        # Execute the query and commit the session once so that all mutations
+        # of the request are committed in a single transaction. Each mutation
+        # is executed within a SAVEPOINT so that a failing mutation only rolls
+        # back its own changes while those of the preceding mutations are
+        # committed. The session is rolled back should the execution or the
+        # commit fail.
+        try:
+            result = self._execute_document(
+                query=query,
+                variable_values=variable_values,
+                operation_name=operation_name,
+                context_value=ContextGraphQl(
+                    cfg=self.cfg,
+                    token=token,
+                    token_payload=token_payload,
+                    session=self.scoped_session,
+                    loaders=create_loaders(session=self.scoped_session),
+                ),
+                middleware=[self.middleware_savepoint],
+            )
+            self.scoped_session.commit()
+        except Exception:
+            self.scoped_session.rollback()
+            raise
 
         return result
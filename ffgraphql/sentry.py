@@ -1,9 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import sentry_sdk
-from sentry_sdk.integrations.falcon import FalconIntegration
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
-
 import attrdict
 
 
@@ -21,6 +17,12 @@ def initialize_sentry(cfg: attrdict.AttrDict) -> None:
     if not cfg.sentry.dsn:
         return None
 
+    # The Sentry SDK and its integrations are only imported when Sentry is
+    # configured as importing them is relatively slow.
+    import sentry_sdk
+    from sentry_sdk.integrations.falcon import FalconIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
     sentry_sdk.init(
         dsn=cfg.sentry.dsn,
         integrations=[FalconIntegration(), SqlalchemyIntegration()],
@@ -5,16 +5,29 @@ from typing import List, Optional
 import sqlalchemy
 import sqlalchemy.orm
 import graphene
-from sqlalchemy.dialects import postgresql
-from sqlalchemy import func as sqlalchemy_func
+import graphql
 
 from ffgraphql.types.pubmed_primitives import TypeCitation
 from ffgraphql.types.pubmed_primitives import ModelCitation
 from ffgraphql.types.pubmed_primitives import ModelArticle
-from ffgraphql.types.mt_primitives import ModelTreeNumber
-from ffgraphql.types.mt_primitives import ModelDescriptor
-from ffgraphql.types.mt_primitives import ModelDescriptorTreeNumber
+from ffgraphql.types.pubmed_primitives import (
+    ModelCitationDescriptorQualifier
+)
 from ffgraphql.utils import apply_requested_fields
+from ffgraphql.types.utils import any_of_ids
+from ffgraphql.types.utils import get_descriptor_children
+from ffgraphql.types.utils import filter_by_ids
+
+
+# The number of `ModelCitation` record objects fetched per batch when streaming
+# large result-sets through a server-side cursor.
+YIELD_PER = 500
+
+# The maximum complexity of a citation search and the weight by which each
+# provided MeSH descriptor contributes to it when its children descriptors are
+# included in the search.
+SEARCH_COMPLEXITY_MAX = 10000
+SEARCH_COMPLEXITY_WEIGHT_CHILDREN = 100
 
 
 class TypeCitations(graphene.ObjectType):
@@ -95,7 +108,12 @@ class TypeCitations(graphene.ObjectType):
 
         # Filter to the `ModelCitation` records matching any of the
         # `citation_ids`.
-        query = query.filter(ModelCitation.citation_id.in_(citation_ids))
+        query = filter_by_ids(
+            query=query,
+            column=ModelCitation.citation_id,
+            name="citation_ids",
+            ids=citation_ids,
+        )
 
         # Limit query to fields requested in the GraphQL query adding
         # `load_only` and `joinedload` options as required.
@@ -105,6 +123,12 @@ class TypeCitations(graphene.ObjectType):
             orm_class=ModelCitation,
         )
 
+        # Stream the record objects through a server-side cursor in batches
+        # should more than a single batch be requested so that they aren't all
+        # buffered in memory at once.
+        if len(citation_ids) > YIELD_PER:
+            return query.yield_per(YIELD_PER)
+
         objs = query.all()
 
         return objs
@@ -135,7 +159,12 @@ class TypeCitations(graphene.ObjectType):
 
         # Filter to the `ModelCitation` records matching any of the
         # `citation_ids`.
-        query = query.filter(ModelCitation.pmid.in_(pmids))
+        query = filter_by_ids(
+            query=query,
+            column=ModelCitation.pmid,
+            name="pmids",
+            ids=pmids,
+        )
 
         # Limit query to fields requested in the GraphQL query adding
         # `load_only` and `joinedload` options as required.
@@ -145,6 +174,12 @@ class TypeCitations(graphene.ObjectType):
             orm_class=ModelCitation,
         )
 
+        # Stream the record objects through a server-side cursor in batches
+        # should more than a single batch be requested so that they aren't all
+        # buffered in memory at once.
+        if len(pmids) > YIELD_PER:
+            return query.yield_per(YIELD_PER)
+
         objs = query.all()
 
         return objs
@@ -177,80 +212,38 @@ class TypeCitations(graphene.ObjectType):
         Returns:
              List[ModelCitation]: The list of matched `ModelCitation` objects
                 or an empty list if no match was found.
+
+        Raises:
+            graphql.GraphQLError: Raised if the estimated complexity of the
+                search exceeds `SEARCH_COMPLEXITY_MAX`.
         """
 
+        # Estimate the complexity of the search and reject it before any SQL
+        # is issued should it exceed the allowed maximum as each provided
+        # descriptor may expand to a whole subtree of children descriptors.
+        if do_include_children:
+            weight = SEARCH_COMPLEXITY_WEIGHT_CHILDREN
+        else:
+            weight = 1
+        complexity = len(mesh_descriptor_ids) * weight
+        if complexity > SEARCH_COMPLEXITY_MAX:
+            msg = ("Citation search complexity of {} exceeds the maximum "
+                   "allowed complexity of {}.")
+            msg_fmt = msg.format(complexity, SEARCH_COMPLEXITY_MAX)
+            raise graphql.GraphQLError(message=msg_fmt)
+
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # If the search is to account for the provided descriptors and their
         # children then find all the children descriptor IDs. Otherwise only
         # use the provided ones.
         if do_include_children:
-            # Retrieve all tree-numbers for the specified MeSH descriptors.
-            query_tns = session.query(
-                ModelTreeNumber.tree_number,
-                ModelDescriptorTreeNumber.descriptor_id,
+            map_descriptor_children = get_descriptor_children(
+                session=session,
+                descriptor_ids=mesh_descriptor_ids,
             )
-            query_tns = query_tns.join(ModelTreeNumber.descriptor_tree_numbers)
-            query_tns = query_tns.filter(
-                ModelDescriptorTreeNumber.descriptor_id.in_(
-                    mesh_descriptor_ids,
-                ),
-            )
-            # Retrieve the tree-numbers and associate them with each provided
-            # descriptor ID in `map_descriptor_tns`.
-            map_descriptor_tns = {}
-            tree_numbers_all = []
-            for tree_number, descriptor_id in query_tns.all():
-                map_descriptor_tns.setdefault(
-                    descriptor_id,
-                    [],
-                ).append(tree_number)
-                tree_numbers_all.append(tree_number)
-
-            # Deduplicate the tree-numbers.
-            tree_numbers_all = list(set(tree_numbers_all))
-
-            # If no tree-numbers have been found return an empty list.
-            if not tree_numbers_all:
-                return []
-
-            # Query out the IDs of all children descriptors of all provided
-            # descriptors based on the retrieved tree-numbers.
-            query_descs = session.query(
-                ModelDescriptor.descriptor_id,
-                ModelTreeNumber.tree_number,
-            )
-            query_descs = query_descs.join(ModelDescriptor.tree_numbers)
-            # Children descriptors are found by retrieving all descriptors
-            # with any tree number prefixed by one of the previously found
-            # tree-numbers.
-            query_descs = query_descs.filter(
-                ModelTreeNumber.tree_number.like(
-                    sqlalchemy.any_(postgresql.array(
-                        tuple([
-                            "{}%".format(tn)
-                            for tn in tree_numbers_all
-                        ])
-                    ))
-                )
-            )
-
-            # Retrieve the children descriptor IDs and associate them with each
-            # provided descriptor ID in `map_descriptor_children`.
-            map_descriptor_children = {}
-            for child_descriptor_id, tree_number in query_descs.all():
-                for descriptor_id, tree_numbers in map_descriptor_tns.items():
-                    for tree_number_prefix in tree_numbers:
-                        if tree_number.startswith(tree_number_prefix):
-                            map_descriptor_children.setdefault(
-                                descriptor_id,
-                                [descriptor_id],
-                            ).append(child_descriptor_id)
-            # Unique the descriptor IDs under each provided descriptor ID.
-            for descriptor_id, tree_numbers in map_descriptor_children.items():
-                map_descriptor_children[descriptor_id] = list(set(tree_numbers))
         else:
             map_descriptor_children = {
                 descriptor_id: [descriptor_id]
@@ -261,60 +254,55 @@ class TypeCitations(graphene.ObjectType):
         if not map_descriptor_children:
             return []
 
-        # Create a function to aggregate the MeSH descriptor IDs of queried
-        # citations into an array.
-        array_descriptors = sqlalchemy_func.array_agg(
-            ModelDescriptor.descriptor_id,
-        )
-
         # Find all PubMed citations associated with the MeSH descriptors found
         # prior.
         query = session.query(ModelCitation)
 
-        # Filter citations by associated mesh-descriptors.
-        query = query.join(ModelCitation.descriptors)
-
+        # Filter citations by the publication year of their article.
         if year_beg or year_end:
             query = query.join(ModelCitation.article)
-
-        # Filter studies the year of their start-date.
         if year_beg:
-            query = query.filter(
-                ModelArticle.publication_year >= year_beg
-            )
+            query = query.filter(ModelArticle.publication_year >= year_beg)
         if year_end:
-            query = query.filter(
-                ModelArticle.publication_year <= year_end
-            )
-
-        # Group by citation ID assembling the MeSH descriptor IDs of each study
-        # into arrays. Each citation will pass the filters if it has at least
-        # one of the descriptors under the provided descriptors (which will be
-        # multiple if children descriptors are used). This is achieved through
-        # the overlap `&&` operator which returns `true` if one array shares at
-        # least one element with the other.
-        query = query.group_by(ModelCitation.citation_id)
-        query = query.having(
+            query = query.filter(ModelArticle.publication_year <= year_end)
+
+        # Filter citations by associated MeSH descriptors. Each citation will
+        # pass the filters if it has at least one of the descriptors under each
+        # of the provided descriptors (which will be multiple if children
+        # descriptors are used). Each filter is expressed as an `EXISTS`
+        # semi-join so that citations aren't multiplied by the number of their
+        # descriptors and no grouping is needed to collapse the rows.
+        query = query.filter(
             sqlalchemy.and_(
                 *[
-                    array_descriptors.op("&&")(
-                        sqlalchemy_func.cast(
-                            descriptor_ids,
-                            postgresql.ARRAY(postgresql.BIGINT),
-                        )
+                    session.query(ModelCitationDescriptorQualifier).filter(
+                        ModelCitationDescriptorQualifier.citation_id ==
+                        ModelCitation.citation_id,
+                        ModelCitationDescriptorQualifier.descriptor_id ==
+                        any_of_ids(
+                            name="descriptor_ids_{}".format(index),
+                            ids=descriptor_ids,
+                        ),
+                    ).exists()
+                    for index, descriptor_ids in enumerate(
+                        map_descriptor_children.values()
                     )
-                    for descriptor_ids in map_descriptor_children.values()
                 ]
             )
         )
 
-        # Limit query to fields requested in the GraphQL query.
+        # Limit query to fields requested in the GraphQL query populating the
+        # article off the existing join if it was joined for the year filters.
         query = apply_requested_fields(
             info=info,
             query=query,
             orm_class=ModelCitation,
+            names_joined={"article"} if (year_beg or year_end) else None,
         )
 
-        objs = query.all()
+        # Stream the record objects through a server-side cursor in batches as
+        # the size of the result-set isn't bounded so that they aren't all
+        # buffered in memory at once.
+        objs = query.yield_per(YIELD_PER)
 
         return objs
@@ -1,5 +1,6 @@
 # coding=utf-8
 
+import collections
 from typing import List, Optional
 
 import sqlalchemy.orm
@@ -15,6 +16,7 @@ from ffgraphql.types.mt_primitives import ModelQualifier
 from ffgraphql.types.mt_primitives import TypeQualifier
 from ffgraphql.utils import extract_requested_fields
 from ffgraphql.utils import apply_requested_fields
+from ffgraphql.types.utils import filter_by_ids
 
 
 class TypeCountCitationsCountry(graphene.ObjectType):
@@ -29,6 +31,13 @@ class TypeCountCitationsCountry(graphene.ObjectType):
     count_citations = graphene.Int(description="The number of citations.")
 
 
+# Plain record resolved through `TypeCountCitationsCountry`.
+RowCountCitationsCountry = collections.namedtuple(
+    "RowCountCitationsCountry",
+    ["country", "count_citations"],
+)
+
+
 class TypeCountCitationsAffiliation(graphene.ObjectType):
     """Graphene type representing a single result of an aggregation operation
     calculating the number of citations by canonical affiliation."""
@@ -41,6 +50,13 @@ class TypeCountCitationsAffiliation(graphene.ObjectType):
     count_citations = graphene.Int(description="The number of citations.")
 
 
+# Plain record resolved through `TypeCountCitationsAffiliation`.
+RowCountCitationsAffiliation = collections.namedtuple(
+    "RowCountCitationsAffiliation",
+    ["affiliation_canonical", "count_citations"],
+)
+
+
 class TypeCountCitationsQualifier(graphene.ObjectType):
     """Graphene type representing a single result of an aggregation operation
     calculating the number of citations by MeSH qualifier."""
@@ -53,6 +69,13 @@ class TypeCountCitationsQualifier(graphene.ObjectType):
     count_citations = graphene.Int(description="The number of citations.")
 
 
+# Plain record resolved through `TypeCountCitationsQualifier`.
+RowCountCitationsQualifier = collections.namedtuple(
+    "RowCountCitationsQualifier",
+    ["qualifier", "count_citations"],
+)
+
+
 class TypeCitationsStats(graphene.ObjectType):
 
     count_citations_by_country = graphene.List(
@@ -82,13 +105,39 @@ class TypeCitationsStats(graphene.ObjectType):
         limit=graphene.Argument(type=graphene.Int, required=False),
     )
 
+    @staticmethod
+    def _query_article_ids(
+        session: sqlalchemy.orm.Session,
+        citation_ids: List[int],
+    ) -> sqlalchemy.orm.Query:
+        """ Creates a query selecting the article IDs of the given citations
+            to be used as a subquery.
+
+        Args:
+            session (sqlalchemy.orm.Session): The SQLAlchemy session.
+            citation_ids (List[int]): A list of citation IDs.
+
+        Returns:
+            sqlalchemy.orm.Query: The query selecting the article IDs.
+        """
+
+        query = session.query(ModelCitation.article_id)
+        query = filter_by_ids(
+            query=query,
+            column=ModelCitation.citation_id,
+            name="citation_ids",
+            ids=citation_ids,
+        )
+
+        return query
+
     @staticmethod
     def resolve_count_citations_by_country(
         args: dict,
         info: graphene.ResolveInfo,
         citation_ids: List[int],
         limit: Optional[int] = None,
-    ) -> List[TypeCountCitationsCountry]:
+    ) -> List[RowCountCitationsCountry]:
         """Creates a list of `TypeCountCitationsCountry` objects with the number
         of citations per country.
 
@@ -107,31 +156,41 @@ class TypeCitationsStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
-        # Define the `COUNT(citations.citation_id)` function.
-        func_count_citations = sqlalchemy_func.count(
-            sqlalchemy_func.distinct(ModelCitation.citation_id),
+        # Query out the IDs of the articles of the citations.
+        query_article_ids = TypeCitationsStats._query_article_ids(
+            session=session,
+            citation_ids=citation_ids,
         )
 
-        # Query out the count of citations by country.
-        query = session.query(
-            ModelAffiliationCanonical.country,
-            func_count_citations,
+        # Query out the distinct pairs of country and article ID so that the
+        # citations, which map one-to-one to their articles, are deduplicated
+        # once prior to being counted.
+        query_pairs = session.query(
+            ModelAffiliationCanonical.country.label("country"),
+            ModelArticleAuthorAffiliation.article_id.label("article_id"),
         )  # type: sqlalchemy.orm.Query
-        query = query.join(
+        query_pairs = query_pairs.join(
             ModelArticleAuthorAffiliation,
             ModelAffiliationCanonical.affiliation_canonical_id ==
             ModelArticleAuthorAffiliation.affiliation_canonical_id,
         )
-        query = query.join(
-            ModelCitation,
-            ModelCitation.article_id ==
-            ModelArticleAuthorAffiliation.article_id,
+        query_pairs = query_pairs.filter(
+            ModelArticleAuthorAffiliation.article_id.in_(query_article_ids),
         )
-        query = query.filter(ModelCitation.citation_id.in_(citation_ids))
+        subquery_pairs = query_pairs.distinct().subquery()
+
+        # Define the `COUNT(*)` function.
+        func_count_citations = sqlalchemy_func.count()
+
+        # Query out the count of citations by country.
+        query = session.query(
+            subquery_pairs.c.country,
+            func_count_citations,
+        )  # type: sqlalchemy.orm.Query
         # Group by citation country.
-        query = query.group_by(ModelAffiliationCanonical.country)
+        query = query.group_by(subquery_pairs.c.country)
         # Order by the number of studies.
         query = query.order_by(func_count_citations.desc())
 
@@ -141,10 +200,10 @@ class TypeCitationsStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountCitationsCountry`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountCitationsCountry`
+        # records.
         objs = [
-            TypeCountCitationsCountry(
+            RowCountCitationsCountry(
                 country=result[0],
                 count_citations=result[1]
             ) for result in results
@@ -158,7 +217,7 @@ class TypeCitationsStats(graphene.ObjectType):
         info: graphene.ResolveInfo,
         citation_ids: List[int],
         limit: Optional[int] = None,
-    ) -> List[TypeCountCitationsAffiliation]:
+    ) -> List[RowCountCitationsAffiliation]:
         """Creates a list of `TypeCountCitationsAffiliation` objects with the
         number of citations per affiliation.
 
@@ -177,35 +236,58 @@ class TypeCitationsStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
-        # Define the `COUNT(citations.citation_id)` function.
-        func_count_citations = sqlalchemy_func.count(
-            sqlalchemy_func.distinct(ModelCitation.citation_id),
+        # Query out the IDs of the articles of the citations.
+        query_article_ids = TypeCitationsStats._query_article_ids(
+            session=session,
+            citation_ids=citation_ids,
         )
 
-        # Query out the count of citations by country.
+        # Query out the distinct pairs of canonical affiliation ID and article
+        # ID so that the citations, which map one-to-one to their articles,
+        # are deduplicated once prior to being counted.
+        query_pairs = session.query(
+            ModelArticleAuthorAffiliation.affiliation_canonical_id.label(
+                "affiliation_canonical_id",
+            ),
+            ModelArticleAuthorAffiliation.article_id.label("article_id"),
+        )  # type: sqlalchemy.orm.Query
+        query_pairs = query_pairs.filter(
+            ModelArticleAuthorAffiliation.article_id.in_(query_article_ids),
+        )
+        subquery_pairs = query_pairs.distinct().subquery()
+
+        # Query out the count of citations by canonical affiliation ID.
+        subquery_counts = session.query(
+            subquery_pairs.c.affiliation_canonical_id,
+            sqlalchemy_func.count().label("count_citations"),
+        )
+        subquery_counts = subquery_counts.group_by(
+            subquery_pairs.c.affiliation_canonical_id,
+        )
+        # Apply limit (if defined) within the subquery so that only the top
+        # counts are joined against the `ModelAffiliationCanonical` records.
+        if limit:
+            subquery_counts = subquery_counts.order_by(
+                sqlalchemy_func.count().desc(),
+            )
+            subquery_counts = subquery_counts.limit(limit=limit)
+        subquery_counts = subquery_counts.subquery()
+
+        # Query out the canonical affiliations alongside their citation
+        # counts.
         query = session.query(
             ModelAffiliationCanonical,
-            func_count_citations,
+            subquery_counts.c.count_citations,
         )  # type: sqlalchemy.orm.Query
         query = query.join(
-            ModelArticleAuthorAffiliation,
+            subquery_counts,
             ModelAffiliationCanonical.affiliation_canonical_id ==
-            ModelArticleAuthorAffiliation.affiliation_canonical_id,
+            subquery_counts.c.affiliation_canonical_id,
         )
-        query = query.join(
-            ModelCitation,
-            ModelCitation.article_id ==
-            ModelArticleAuthorAffiliation.article_id,
-        )
-        query = query.filter(ModelCitation.citation_id.in_(citation_ids))
-        # Group by citation country.
-        query = query.group_by(
-            ModelAffiliationCanonical.affiliation_canonical_id,
-        )
-        # Order by the number of studies.
-        query = query.order_by(func_count_citations.desc())
+        # Preserve the order by the number of citations.
+        query = query.order_by(subquery_counts.c.count_citations.desc())
 
         # Extract the fields requested in the GraphQL query.
         fields = extract_requested_fields(
@@ -223,16 +305,12 @@ class TypeCitationsStats(graphene.ObjectType):
             fields={"affiliation": fields},
         )
 
-        # Apply limit (if defined).
-        if limit:
-            query = query.limit(limit=limit)
-
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountCitationsCountry`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountCitationsAffiliation`
+        # records.
         objs = [
-            TypeCountCitationsAffiliation(
+            RowCountCitationsAffiliation(
                 affiliation_canonical=result[0],
                 count_citations=result[1]
             ) for result in results
@@ -246,7 +324,7 @@ class TypeCitationsStats(graphene.ObjectType):
         info: graphene.ResolveInfo,
         citation_ids: List[int],
         limit: Optional[int] = None,
-    ) -> List[TypeCountCitationsQualifier]:
+    ) -> List[RowCountCitationsQualifier]:
         """Creates a list of `TypeCountCitationsQualifier` objects with the
         number of citations per qualifier.
 
@@ -265,34 +343,52 @@ class TypeCitationsStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
-        # Define the `COUNT(citations.citation_id)` function.
-        func_count_citations = sqlalchemy_func.count(
-            sqlalchemy_func.distinct(
-                ModelCitationDescriptorQualifier.citation_id
+        # Query out the distinct pairs of qualifier ID and citation ID so that
+        # the citations are deduplicated once prior to being counted.
+        query_pairs = session.query(
+            ModelCitationDescriptorQualifier.qualifier_id.label(
+                "qualifier_id",
             ),
+            ModelCitationDescriptorQualifier.citation_id.label("citation_id"),
+        )  # type: sqlalchemy.orm.Query
+        query_pairs = filter_by_ids(
+            query=query_pairs,
+            column=ModelCitationDescriptorQualifier.citation_id,
+            name="citation_ids",
+            ids=citation_ids,
         )
+        subquery_pairs = query_pairs.distinct().subquery()
 
-        # Query out the count of citations by country.
+        # Query out the count of citations by qualifier ID.
+        subquery_counts = session.query(
+            subquery_pairs.c.qualifier_id,
+            sqlalchemy_func.count().label("count_citations"),
+        )
+        subquery_counts = subquery_counts.group_by(
+            subquery_pairs.c.qualifier_id,
+        )
+        # Apply limit (if defined) within the subquery so that only the top
+        # counts are joined against the `ModelQualifier` records.
+        if limit:
+            subquery_counts = subquery_counts.order_by(
+                sqlalchemy_func.count().desc(),
+            )
+            subquery_counts = subquery_counts.limit(limit=limit)
+        subquery_counts = subquery_counts.subquery()
+
+        # Query out the qualifiers alongside their citation counts.
         query = session.query(
             ModelQualifier,
-            func_count_citations,
+            subquery_counts.c.count_citations,
         )  # type: sqlalchemy.orm.Query
         query = query.join(
-            ModelCitationDescriptorQualifier,
-            ModelCitationDescriptorQualifier.qualifier_id ==
-            ModelQualifier.qualifier_id,
+            subquery_counts,
+            ModelQualifier.qualifier_id == subquery_counts.c.qualifier_id,
         )
-        query = query.filter(
-            ModelCitationDescriptorQualifier.citation_id.in_(citation_ids),
-        )
-        # Group by qualifier.
-        query = query.group_by(
-            ModelQualifier.qualifier_id,
-        )
-        # Order by the number of studies.
-        query = query.order_by(func_count_citations.desc())
+        # Preserve the order by the number of citations.
+        query = query.order_by(subquery_counts.c.count_citations.desc())
 
         # Extract the fields requested in the GraphQL query.
         fields = extract_requested_fields(
@@ -310,16 +406,12 @@ class TypeCitationsStats(graphene.ObjectType):
             fields={"qualifier": fields},
         )
 
-        # Apply limit (if defined).
-        if limit:
-            query = query.limit(limit=limit)
-
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountCitationsQualifier`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountCitationsQualifier`
+        # records.
         objs = [
-            TypeCountCitationsQualifier(
+            RowCountCitationsQualifier(
                 qualifier=result[0],
                 count_citations=result[1]
             ) for result in results
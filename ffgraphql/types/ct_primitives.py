@@ -40,6 +40,8 @@ from fform.orm_ct import RoleType as EnumRoleType
 from fform.orm_ct import OutcomeType as EnumOutcomeType
 from fform.orm_ct import ReferenceType as EnumReferenceType
 
+from ffgraphql.utils import load_relationship
+
 
 TypeEnumOverallStatus = graphene.Enum.from_enum(EnumOverallStatus)
 TypeEnumPhase = graphene.Enum.from_enum(EnumPhase)
@@ -122,6 +124,15 @@ class TypeLocation(SQLAlchemyObjectType):
     def resolve_status(self, info, **kwargs):
         return self.status
 
+    def resolve_facility(self, info, **kwargs):
+        return load_relationship(
+            info=info,
+            obj=self,
+            name_relationship="facility",
+            name_loader="facility",
+            key=self.facility_id,
+        )
+
 
 class TypeFacility(SQLAlchemyObjectType):
     class Meta:
@@ -163,6 +174,15 @@ class TypeStudyDescriptor(SQLAlchemyObjectType):
     def resolve_mesh_term_type(self, info, **kwargs):
         return self.study_descriptor_type
 
+    def resolve_descriptor(self, info, **kwargs):
+        return load_relationship(
+            info=info,
+            obj=self,
+            name_relationship="descriptor",
+            name_loader="descriptor",
+            key=self.descriptor_id,
+        )
+
 
 class TypeEligibility(SQLAlchemyObjectType):
 
@@ -104,7 +104,7 @@ class TypeDescriptors(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Query out `ModelDescriptor`.
         query = session.query(ModelDescriptor)  # type: sqlalchemy.orm.Query
@@ -151,7 +151,7 @@ class TypeDescriptors(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define a function to calculate the maximum similarity between a
         # descriptor's synonyms and the synonym query.
@@ -16,11 +16,22 @@ from fform.orm_pubmed import (
 from fform.orm_pubmed import AffiliationCanonical as ModelAffiliationCanonical
 from fform.orm_pubmed import JournalIssnType as EnumJournalIssn
 
+from ffgraphql.utils import load_relationship
+
 
 class TypeCitation(SQLAlchemyObjectType):
     class Meta:
         model = ModelCitation
 
+    def resolve_article(self, info, **kwargs):
+        return load_relationship(
+            info=info,
+            obj=self,
+            name_relationship="article",
+            name_loader="article",
+            key=self.article_id,
+        )
+
 
 class TypeArticle(SQLAlchemyObjectType):
     class Meta:
@@ -41,6 +52,15 @@ class TypeCitationDescriptorQualifier(SQLAlchemyObjectType):
     class Meta:
         model = ModelCitationDescriptorQualifier
 
+    def resolve_descriptor(self, info, **kwargs):
+        return load_relationship(
+            info=info,
+            obj=self,
+            name_relationship="descriptor",
+            name_loader="descriptor",
+            key=self.descriptor_id,
+        )
+
 
 class TypeAffiliationCanonical(SQLAlchemyObjectType):
     class Meta:
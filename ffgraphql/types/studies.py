@@ -12,6 +12,7 @@ from graphene.utils.str_converters import to_snake_case
 
 from ffgraphql.types.ct_primitives import TypeStudy
 from ffgraphql.types.ct_primitives import ModelStudy
+from ffgraphql.types.ct_primitives import ModelStudyDescriptor
 from ffgraphql.types.ct_primitives import ModelFacilityCanonical
 from ffgraphql.types.ct_primitives import ModelIntervention
 from ffgraphql.types.ct_primitives import ModelEligibility
@@ -26,11 +27,9 @@ from ffgraphql.types.ct_primitives import EnumStudy
 from ffgraphql.types.ct_primitives import TypeEnumOrder
 from ffgraphql.types.ct_primitives import EnumGender
 from ffgraphql.types.ct_primitives import TypeEnumGender
-from ffgraphql.types.mt_primitives import ModelTreeNumber
-from ffgraphql.types.mt_primitives import ModelDescriptor
-from ffgraphql.types.mt_primitives import ModelDescriptorTreeNumber
 from ffgraphql.utils import apply_requested_fields
 from ffgraphql.types.utils import add_canonical_facility_fix_filter
+from ffgraphql.types.utils import get_descriptor_children
 
 
 class TypeStudies(graphene.ObjectType):
@@ -530,7 +529,7 @@ class TypeStudies(graphene.ObjectType):
             )
         if year_end:
             query = query.filter(
-                ModelStudy.start_date <= datetime.date(year_end, 12, 31)
+                ModelStudy.start_date < datetime.date(year_end + 1, 1, 1)
             )
 
         # Filter studies by eligibility age.
@@ -582,76 +581,16 @@ class TypeStudies(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # If the search is to account for the provided descriptors and their
         # children then find all the children descriptor IDs. Otherwise only
         # use the provided ones.
         if do_include_children:
-            # Retrieve all tree-numbers for the specified MeSH descriptors.
-            query_tns = session.query(
-                ModelTreeNumber.tree_number,
-                ModelDescriptorTreeNumber.descriptor_id,
+            map_descriptor_children = get_descriptor_children(
+                session=session,
+                descriptor_ids=mesh_descriptor_ids,
             )
-            query_tns = query_tns.join(ModelTreeNumber.descriptor_tree_numbers)
-            query_tns = query_tns.filter(
-                ModelDescriptorTreeNumber.descriptor_id.in_(
-                    mesh_descriptor_ids,
-                ),
-            )
-            # Retrieve the tree-numbers and associate them with each provided
-            # descriptor ID in `map_descriptor_tns`.
-            map_descriptor_tns = {}
-            tree_numbers_all = []
-            for tree_number, descriptor_id in query_tns.all():
-                map_descriptor_tns.setdefault(
-                    descriptor_id,
-                    [],
-                ).append(tree_number)
-                tree_numbers_all.append(tree_number)
-
-            # Deduplicate the tree-numbers.
-            tree_numbers_all = list(set(tree_numbers_all))
-
-            # If no tree-numbers have been found return an empty list.
-            if not tree_numbers_all:
-                return []
-
-            # Query out the IDs of all children descriptors of all provided
-            # descriptors based on the retrieved tree-numbers.
-            query_descs = session.query(
-                ModelDescriptor.descriptor_id,
-                ModelTreeNumber.tree_number,
-            )
-            query_descs = query_descs.join(ModelDescriptor.tree_numbers)
-            # Children descriptors are found by retrieving all descriptors
-            # with any tree number prefixed by one of the previously found
-            # tree-numbers.
-            query_descs = query_descs.filter(
-                ModelTreeNumber.tree_number.like(
-                    sqlalchemy.any_(postgresql.array(
-                        tuple([
-                            "{}%".format(tn)
-                            for tn in tree_numbers_all
-                        ])
-                    ))
-                )
-            )
-
-            # Retrieve the children descriptor IDs and associate them with each
-            # provided descriptor ID in `map_descriptor_children`.
-            map_descriptor_children = {}
-            for child_descriptor_id, tree_number in query_descs.all():
-                for descriptor_id, tree_numbers in map_descriptor_tns.items():
-                    for tree_number_prefix in tree_numbers:
-                        if tree_number.startswith(tree_number_prefix):
-                            map_descriptor_children.setdefault(
-                                descriptor_id,
-                                [descriptor_id],
-                            ).append(child_descriptor_id)
-            # Unique the descriptor IDs under each provided descriptor ID.
-            for descriptor_id, tree_numbers in map_descriptor_children.items():
-                map_descriptor_children[descriptor_id] = list(set(tree_numbers))
         else:
             map_descriptor_children = {
                 descriptor_id: [descriptor_id]
@@ -662,19 +601,10 @@ class TypeStudies(graphene.ObjectType):
         if not map_descriptor_children:
             return []
 
-        # Create a function to aggregate the MeSH descriptor IDs of queried
-        # studies into an array.
-        array_descriptors = sqlalchemy_func.array_agg(
-            ModelDescriptor.descriptor_id,
-        )
-
         # Find all clinical-trial studies associated with the MeSH descriptors
         # found prior.
         query = session.query(ModelStudy)
 
-        # Filter studies by associated mesh-descriptors.
-        query = query.join(ModelStudy.descriptors)
-
         # Filter studies the year of their start-date.
         if year_beg:
             query = query.filter(
@@ -682,7 +612,7 @@ class TypeStudies(graphene.ObjectType):
             )
         if year_end:
             query = query.filter(
-                ModelStudy.start_date <= datetime.date(year_end, 12, 31)
+                ModelStudy.start_date < datetime.date(year_end + 1, 1, 1)
             )
 
         # Join on the `eligibility` relationship if any of the fiters that
@@ -711,32 +641,34 @@ class TypeStudies(graphene.ObjectType):
                 query=query, age_beg=age_beg, age_end=age_end
             )
 
-        # Group by study ID assembling the MeSH descriptor IDs of each study
-        # into arrays. Each study will pass the filters if it has at least one
-        # of the descriptors under the provided descriptors (which will be
-        # multiple if children descriptors are used). This is achieved through
-        # the overlap `&&` operator which returns `true` if one array shares at
-        # least one element with the other.
-        query = query.group_by(ModelStudy.study_id)
-        query = query.having(
+        # Filter studies by associated MeSH descriptors. Each study will pass
+        # the filters if it has at least one of the descriptors under each of
+        # the provided descriptors (which will be multiple if children
+        # descriptors are used). Each filter is expressed as an `EXISTS`
+        # semi-join against the `studies_descriptors` table so that a study is
+        # never multiplied by the number of its descriptors and no grouping is
+        # needed to collapse the rows.
+        query = query.filter(
             sqlalchemy.and_(
                 *[
-                    array_descriptors.op("&&")(
-                        sqlalchemy_func.cast(
-                            descriptor_ids,
-                            postgresql.ARRAY(postgresql.BIGINT),
-                        )
-                    )
+                    session.query(ModelStudyDescriptor).filter(
+                        ModelStudyDescriptor.study_id == ModelStudy.study_id,
+                        ModelStudyDescriptor.descriptor_id.in_(descriptor_ids),
+                    ).exists()
                     for descriptor_ids in map_descriptor_children.values()
                 ]
             )
         )
 
-        # Limit query to fields requested in the GraphQL query.
+        # Limit query to fields requested in the GraphQL query populating the
+        # eligibility off the existing join if it was joined for the filters.
         query = apply_requested_fields(
             info=info,
             query=query,
             orm_class=ModelStudy,
+            names_joined=(
+                {"eligibility"} if (gender or age_beg or age_end) else None
+            ),
         )
 
         objs = query.all()
@@ -772,7 +704,7 @@ class TypeStudies(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         query = session.query(ModelStudy)  # type: sqlalchemy.orm.query.Query
 
@@ -857,7 +789,7 @@ class TypeStudies(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(studies.study_id)` function.
         func_count_studies = sqlalchemy_func.count(
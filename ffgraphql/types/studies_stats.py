@@ -1,5 +1,6 @@
 # coding=utf-8
 
+import collections
 from typing import List, Optional
 
 import sqlalchemy.orm
@@ -38,6 +39,13 @@ class TypeCountStudiesCountry(graphene.ObjectType):
     count_studies = graphene.Int(description="The number of studies.")
 
 
+# Plain record resolved through `TypeCountStudiesCountry`.
+RowCountStudiesCountry = collections.namedtuple(
+    "RowCountStudiesCountry",
+    ["country", "count_studies"],
+)
+
+
 class TypeCountStudiesOverallStatus(graphene.ObjectType):
     """Graphene type representing a single result of an aggregation operation
     calculating the number of clinical-trial studies by overall-status."""
@@ -49,6 +57,13 @@ class TypeCountStudiesOverallStatus(graphene.ObjectType):
     count_studies = graphene.Int(description="The number of studies.")
 
 
+# Plain record resolved through `TypeCountStudiesOverallStatus`.
+RowCountStudiesOverallStatus = collections.namedtuple(
+    "RowCountStudiesOverallStatus",
+    ["overall_status", "count_studies"],
+)
+
+
 class TypeCountStudiesFacility(graphene.ObjectType):
     """Graphene type representing a single result of an aggregation operation
     calculating the number of clinical-trial studies by canonical facility."""
@@ -62,6 +77,13 @@ class TypeCountStudiesFacility(graphene.ObjectType):
     count_studies = graphene.Int(description="The number of studies.")
 
 
+# Plain record resolved through `TypeCountStudiesFacility`.
+RowCountStudiesFacility = collections.namedtuple(
+    "RowCountStudiesFacility",
+    ["facility_canonical", "count_studies"],
+)
+
+
 class TypeCountStudiesFacilityDescriptor(graphene.ObjectType):
     """ Graphene type representing a single result of an aggregation operation
         calculating the number of clinical-trial studies canonical facility and
@@ -82,6 +104,13 @@ class TypeCountStudiesFacilityDescriptor(graphene.ObjectType):
     count_studies = graphene.Int(description="The number of studies.")
 
 
+# Plain record resolved through `TypeCountStudiesFacilityDescriptor`.
+RowCountStudiesFacilityDescriptor = collections.namedtuple(
+    "RowCountStudiesFacilityDescriptor",
+    ["facility_canonical", "mesh_term", "count_studies"],
+)
+
+
 class TypeCountStudiesDescriptor(graphene.ObjectType):
     """ Graphene type representing a single result of an aggregation operation
         calculating the number of clinical-trial studies by MeSH descriptor.
@@ -95,6 +124,13 @@ class TypeCountStudiesDescriptor(graphene.ObjectType):
     count_studies = graphene.Int(description="The number of studies.")
 
 
+# Plain record resolved through `TypeCountStudiesDescriptor`.
+RowCountStudiesDescriptor = collections.namedtuple(
+    "RowCountStudiesDescriptor",
+    ["mesh_term", "count_studies"],
+)
+
+
 class TypeDateRange(graphene.ObjectType):
     """Graphene type representing a date-range."""
 
@@ -139,6 +175,13 @@ class TypeLatestDescriptor(graphene.ObjectType):
     )
 
 
+# Plain record resolved through `TypeLatestDescriptor`.
+RowLatestDescriptor = collections.namedtuple(
+    "RowLatestDescriptor",
+    ["mesh_term", "date"],
+)
+
+
 class TypeStudiesStats(graphene.ObjectType):
 
     count_studies_by_country = graphene.List(
@@ -529,7 +572,7 @@ class TypeStudiesStats(graphene.ObjectType):
         info: graphene.ResolveInfo,
         study_ids: List[int],
         limit: Optional[int] = None,
-    ) -> List[TypeCountStudiesCountry]:
+    ) -> List[RowCountStudiesCountry]:
         """Creates a list of `TypeCountStudiesCountry` objects with the number
         of clinical-trial studies per country.
 
@@ -548,7 +591,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(studies.study_id)` function.
         func_count_studies = sqlalchemy_func.count(
@@ -578,10 +621,10 @@ class TypeStudiesStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountStudiesCountry`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountStudiesCountry`
+        # records.
         objs = [
-            TypeCountStudiesCountry(
+            RowCountStudiesCountry(
                 country=result[0],
                 count_studies=result[1]
             ) for result in results
@@ -595,7 +638,7 @@ class TypeStudiesStats(graphene.ObjectType):
         info: graphene.ResolveInfo,
         study_ids: List[int],
         limit: Optional[int] = None,
-    ) -> List[TypeCountStudiesOverallStatus]:
+    ) -> List[RowCountStudiesOverallStatus]:
         """Creates a list of `TypeCountStudiesOverallStatus` objects with the
         number of clinical-trial studies per overall-status.
 
@@ -614,7 +657,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(studies.study_id)` function.
         func_count_studies = sqlalchemy_func.count(
@@ -641,10 +684,10 @@ class TypeStudiesStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountStudiesOverallStatus`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountStudiesOverallStatus`
+        # records.
         objs = [
-            TypeCountStudiesOverallStatus(
+            RowCountStudiesOverallStatus(
                 overall_status=EnumOverallStatus(result[0]).value,
                 count_studies=result[1]
             ) for result in results
@@ -669,7 +712,7 @@ class TypeStudiesStats(graphene.ObjectType):
         order: Optional[TypeEnumOrder] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[TypeCountStudiesFacility]:
+    ) -> List[RowCountStudiesFacility]:
         """ Creates a list of `TypeCountStudiesFacility` objects with the number
             of clinical-trial studies per canonical facility.
 
@@ -713,7 +756,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(studies.study_id)` function.
         func_count_studies = sqlalchemy_func.count(
@@ -792,10 +835,10 @@ class TypeStudiesStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountStudiesFacility`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountStudiesFacility`
+        # records.
         objs = [
-            TypeCountStudiesFacility(
+            RowCountStudiesFacility(
                 facility_canonical=result[0],
                 count_studies=result[1]
             ) for result in results
@@ -849,7 +892,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(facilitiesCanonical.facility_canonical_id)`
         # function.
@@ -894,7 +937,7 @@ class TypeStudiesStats(graphene.ObjectType):
         facility_canonical_ids: Optional[List[int]] = None,
         mesh_term_type: Optional[EnumMeshTerm] = None,
         limit: Optional[int] = None,
-    ) -> List[TypeCountStudiesFacilityDescriptor]:
+    ) -> List[RowCountStudiesFacilityDescriptor]:
         """Creates a list of `TypeCountStudiesFacilityMeshTerm` objects with
         the number of clinical-trial studies per canonical facility and
         mesh-term.
@@ -911,14 +954,14 @@ class TypeStudiesStats(graphene.ObjectType):
                 `None` in which case all results are returned.
 
         Returns:
-             List[TypeCountStudiesFacilityDescriptor]: The list of
+             List[RowCountStudiesFacilityDescriptor]: The list of
                 `TypeCountStudiesFacilityDescriptor` objects with the results of
                 the aggregation.
         """
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(studies.study_id)` function.
         func_count_studies = sqlalchemy_func.count(
@@ -981,10 +1024,10 @@ class TypeStudiesStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountStudiesFacility`
-        # objects.
+        # Wrap the results of the aggregation in
+        # `RowCountStudiesFacilityDescriptor` records.
         objs = [
-            TypeCountStudiesFacilityDescriptor(
+            RowCountStudiesFacilityDescriptor(
                 facility_canonical=result[0],
                 mesh_term=result[1],
                 count_studies=result[2]
@@ -1000,7 +1043,7 @@ class TypeStudiesStats(graphene.ObjectType):
         study_ids: List[int],
         mesh_term_type: Optional[EnumMeshTerm] = None,
         limit: Optional[int] = None,
-    ) -> List[TypeCountStudiesDescriptor]:
+    ) -> List[RowCountStudiesDescriptor]:
         """Creates a list of `TypeCountStudiesDescriptor` objects with the
             number of clinical-trial studies per descriptor.
 
@@ -1014,14 +1057,14 @@ class TypeStudiesStats(graphene.ObjectType):
                 `None` in which case all results are returned.
 
         Returns:
-             List[TypeCountStudiesFacilityDescriptor]: The list of
+             List[RowCountStudiesFacilityDescriptor]: The list of
                 `TypeCountStudiesFacilityDescriptor` objects with the results of
                 the aggregation.
         """
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `COUNT(studies.study_id)` function.
         func_count_studies = sqlalchemy_func.count(
@@ -1057,10 +1100,10 @@ class TypeStudiesStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeCountStudiesDescriptor`
-        # objects.
+        # Wrap the results of the aggregation in `RowCountStudiesDescriptor`
+        # records.
         objs = [
-            TypeCountStudiesDescriptor(
+            RowCountStudiesDescriptor(
                 mesh_term=result[0],
                 count_studies=result[1]
             ) for result in results
@@ -1123,7 +1166,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Retrieve the unique cities out of the studies.
         cities = TypeStudiesStats._query_unique_geographies(
@@ -1158,7 +1201,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Retrieve the unique states out of the studies.
         states = TypeStudiesStats._query_unique_geographies(
@@ -1190,7 +1233,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Retrieve the unique countries out of the studies.
         countries = TypeStudiesStats._query_unique_geographies(
@@ -1220,7 +1263,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `MIN(studies.start_date)` function.
         func_min_date = sqlalchemy_func.min(ModelStudy.start_date)
@@ -1263,7 +1306,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the function to calculate the minimum elligible age in seconds.
         func_min_age_sec = sqlalchemy_func.min(
@@ -1310,7 +1353,7 @@ class TypeStudiesStats(graphene.ObjectType):
         study_ids: List[int],
         mesh_term_type: Optional[EnumMeshTerm] = None,
         limit: Optional[int] = None,
-    ) -> List[TypeLatestDescriptor]:
+    ) -> List[RowLatestDescriptor]:
         """ Creates a list of `TypeLatestDescriptor` objects with the latest
             descriptors.
 
@@ -1325,13 +1368,13 @@ class TypeStudiesStats(graphene.ObjectType):
                 return.
 
         Returns:
-             List[TypeLatestDescriptor]: The list of `TypeLatestDescriptor`
+             List[RowLatestDescriptor]: The list of `TypeLatestDescriptor`
                 objects with the results of the aggregation.
         """
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Define the `MIN(studies.start_date)` function.
         func_min_start_date = sqlalchemy_func.min(ModelStudy.start_date)
@@ -1370,9 +1413,9 @@ class TypeStudiesStats(graphene.ObjectType):
 
         results = query.all()
 
-        # Wrap the results of the aggregation in `TypeLatestDescriptor` objects.
+        # Wrap the results of the aggregation in `RowLatestDescriptor` records.
         objs = [
-            TypeLatestDescriptor(
+            RowLatestDescriptor(
                 mesh_term=result[0],
                 date=result[1],
             ) for result in results
@@ -1405,7 +1448,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Query out the MeSH descriptors.
         query = session.query(ModelDescriptor)  # type: sqlalchemy.orm.Query
@@ -1455,7 +1498,7 @@ class TypeStudiesStats(graphene.ObjectType):
 
         # Retrieve the session out of the context as the `get_query` method
         # automatically selects the model.
-        session = info.context.get("session")  # type: sqlalchemy.orm.Session
+        session = info.context.session  # type: sqlalchemy.orm.Session
 
         # Query out the canonical facilities descriptors.
         query = session.query(
@@ -1,9 +1,22 @@
 # coding=utf-8
 
+from typing import Dict, List
+
 import sqlalchemy.orm
 from sqlalchemy import func as sqlalchemy_func
+from sqlalchemy.dialects import postgresql
 
 from ffgraphql.types.ct_primitives import ModelFacilityCanonical
+from ffgraphql.types.mt_primitives import ModelTreeNumber
+from ffgraphql.types.mt_primitives import ModelDescriptor
+from ffgraphql.types.mt_primitives import ModelDescriptorTreeNumber
+from ffgraphql.caches import CacheLru
+
+
+# Cache mapping the sorted IDs of MeSH descriptors to the IDs of their children
+# descriptors as retrieved by `get_descriptor_children`. As the MeSH tree only
+# changes upon a new MeSH release the entries are kept for an hour.
+cache_descriptor_children = CacheLru(maxsize=10000, ttl=3600)
 
 
 def add_canonical_facility_fix_filter(
@@ -58,3 +71,182 @@ def add_canonical_facility_fix_filter(
     )
 
     return query
+
+
+# The number of IDs above which `filter_by_ids` filters via a join against the
+# IDs rather than an `ANY` expression.
+IDS_JOIN_THRESHOLD = 64
+
+
+def _bind_ids(
+    name: str,
+    ids: List[int],
+) -> sqlalchemy.sql.elements.BindParameter:
+    """ Creates an array bound-parameter holding a list of IDs.
+
+    Args:
+        name (str): The name of the bound-parameter.
+        ids (List[int]): The IDs to be bound.
+
+    Returns:
+        sqlalchemy.sql.elements.BindParameter: The bound-parameter.
+    """
+
+    return sqlalchemy.bindparam(
+        name,
+        value=ids,
+        type_=postgresql.ARRAY(postgresql.BIGINT),
+    )
+
+
+def any_of_ids(
+    name: str,
+    ids: List[int],
+) -> sqlalchemy.sql.elements.ColumnElement:
+    """ Creates an `ANY` expression over a single array bound-parameter holding
+        a list of IDs to be used in place of an `IN` clause.
+
+    Note:
+        Unlike `IN` which renders a distinct bound-parameter per ID, and thus
+        a distinct statement per number of IDs, the array is passed as a
+        single parameter so that the rendered SQL doesn't vary with the IDs
+        and the statement can be reused.
+
+    Args:
+        name (str): The name of the bound-parameter.
+        ids (List[int]): The IDs to be bound.
+
+    Returns:
+        sqlalchemy.sql.elements.ColumnElement: The `ANY` expression to be
+            compared against a column, e.g., `column == any_of_ids(...)`.
+    """
+
+    return sqlalchemy.any_(_bind_ids(name=name, ids=ids))
+
+
+def filter_by_ids(
+    query: sqlalchemy.orm.Query,
+    column: sqlalchemy.orm.attributes.InstrumentedAttribute,
+    name: str,
+    ids: List[int],
+) -> sqlalchemy.orm.Query:
+    """ Filters the `query` to the records whose `column` matches any of the
+        provided IDs.
+
+    Note:
+        Up to `IDS_JOIN_THRESHOLD` IDs the filter is applied via an `ANY`
+        expression. Above that the query is joined against the unnested IDs
+        allowing the planner to see the number of IDs and perform index
+        lookups per ID rather than mis-costing a large list.
+
+    Args:
+        query (sqlalchemy.orm.Query): The query on which to add the filter.
+        column (sqlalchemy.orm.attributes.InstrumentedAttribute): The column
+            matched against the IDs.
+        name (str): The name of the bound-parameter holding the IDs.
+        ids (List[int]): The IDs to filter by.
+
+    Returns:
+        sqlalchemy.orm.Query: The updated query.
+    """
+
+    if len(ids) <= IDS_JOIN_THRESHOLD:
+        return query.filter(column == any_of_ids(name=name, ids=ids))
+
+    # Unnest the distinct IDs into a derived table so that duplicate IDs don't
+    # multiply the joined records.
+    subquery_ids = sqlalchemy.select([
+        sqlalchemy_func.unnest(_bind_ids(name=name, ids=ids)).label("id"),
+    ]).distinct().alias(name)
+
+    return query.join(subquery_ids, column == subquery_ids.c.id)
+
+
+def get_descriptor_children(
+    session: sqlalchemy.orm.Session,
+    descriptor_ids: List[int],
+) -> Dict[int, List[int]]:
+    """ Retrieves the IDs of the children MeSH descriptors of each of the
+        provided MeSH descriptors.
+
+    Note:
+        As each tree-number falls within its own range each provided
+        descriptor ID is also retrieved as its own child. Results are cached
+        under `cache_descriptor_children` and the returned `dict` should
+        therefore not be modified.
+
+    Args:
+        session (sqlalchemy.orm.Session): A SQLAlchemy session that will be
+            used to perform the interaction with the SQL database.
+        descriptor_ids (List[int]): The IDs of the MeSH descriptors.
+
+    Returns:
+        Dict[int, List[int]]: The IDs of the children descriptors keyed by the
+            ID of the provided descriptor they fall under.
+    """
+
+    key = tuple(sorted(set(descriptor_ids)))
+    map_descriptor_children = cache_descriptor_children.get(key)
+    if map_descriptor_children is not None:
+        return map_descriptor_children
+
+    # Define a subquery retrieving all tree-numbers for the specified MeSH
+    # descriptors.
+    subquery_tns = session.query(
+        ModelTreeNumber.tree_number,
+        ModelDescriptorTreeNumber.descriptor_id,
+    )
+    subquery_tns = subquery_tns.join(
+        ModelTreeNumber.descriptor_tree_numbers,
+    )
+    subquery_tns = subquery_tns.filter(
+        ModelDescriptorTreeNumber.descriptor_id == any_of_ids(
+            name="mesh_descriptor_ids",
+            ids=list(key),
+        ),
+    )
+    subquery_tns = subquery_tns.subquery()
+
+    # Query out the IDs of all children descriptors of all provided
+    # descriptors paired with the IDs of the latter through a join against the
+    # subquery so that a single statement is issued. Children descriptors are
+    # those with a tree-number equal to, or nested under, one of the
+    # tree-numbers of the provided descriptors. As tree-numbers only consist
+    # of letters, digits, and dots these fall within the byte-wise range
+    # between the tree-number and the tree-number suffixed by `/`, the
+    # character following `.`. The range is expressed via the `~>=~` and `~<~`
+    # operators, which `LIKE 'prefix%'` is rewritten to, rather than a `LIKE`
+    # with a non-constant pattern so that a `varchar_pattern_ops` index on the
+    # tree-numbers can serve it through a parameterized range-scan.
+    query_descs = session.query(
+        subquery_tns.c.descriptor_id,
+        ModelDescriptor.descriptor_id,
+    )
+    query_descs = query_descs.select_from(ModelDescriptor)
+    query_descs = query_descs.join(ModelDescriptor.tree_numbers)
+    query_descs = query_descs.join(
+        subquery_tns,
+        sqlalchemy.and_(
+            ModelTreeNumber.tree_number.op("~>=~", is_comparison=True)(
+                subquery_tns.c.tree_number,
+            ),
+            ModelTreeNumber.tree_number.op("~<~", is_comparison=True)(
+                subquery_tns.c.tree_number.concat("/"),
+            ),
+        ),
+    )
+    # Deduplicate the pairs in the database as a descriptor may have multiple
+    # tree-numbers under the same provided descriptor.
+    query_descs = query_descs.distinct()
+
+    # Associate the children descriptor IDs with each provided descriptor ID.
+    map_descriptor_children = {}
+    for descriptor_id, child_descriptor_id in query_descs.all():
+        map_descriptor_children.setdefault(
+            descriptor_id,
+            [],
+        ).append(child_descriptor_id)
+
+    cache_descriptor_children.set(key, map_descriptor_children)
+
+    return map_descriptor_children
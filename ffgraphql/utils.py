@@ -1,7 +1,7 @@
 # coding=utf-8
 
 import re
-from typing import List, Dict, Union, Type, Optional
+from typing import List, Dict, Union, Type, Optional, Set
 
 import sqlalchemy
 import graphene
@@ -149,16 +149,19 @@ def _get_load_only_fields(
 def _get_query_options(
     fields_all: Dict,
     inspection: sqlalchemy.orm.Mapper,
-    option: Optional[sqlalchemy.orm.strategy_options.Load] = None
+    option: Optional[sqlalchemy.orm.strategy_options.Load] = None,
+    names_joined: Optional[Set[str]] = None,
 ) -> List[sqlalchemy.orm.strategy_options.Load]:
-    """Collects `load_only` and `joinedload` SQLAlchemy Query options based on
-    a GraphQL query accounting for arbitrarily-nested relationships.
+    """Collects `load_only`, `joinedload`, and `selectinload` SQLAlchemy Query
+    options based on a GraphQL query accounting for arbitrarily-nested
+    relationships.
 
-    This function operates in a recursive fashion and collects `load_only` and
-    `joinedload` options for an SQLAlchemy Query object thus limiting the
+    This function operates in a recursive fashion and collects `load_only`
+    and eager-loading options for an SQLAlchemy Query object thus limiting the
     loaded fields of the queried ORM class/table to those requested in the
     GraphQL query. In addition, this function supports arbitrarily nested
-    relationships to the root ORM class adding `joinedload` options to preclude
+    relationships to the root ORM class adding `selectinload` options for
+    collections and `joinedload` options for scalar relationships to preclude
     lazy-loading of those relationships in addition to applying `load_only`
     options to the relationships themselves.
 
@@ -170,6 +173,9 @@ def _get_query_options(
         option (Optional[sqlalchemy.orm.strategy_options.Load]): The root option
             upon which more options will be chained as required. Defaults to
             `None`
+        names_joined (Optional[Set[str]]): The names of the relationships of
+            the ORM class already joined in the query which are loaded via
+            `contains_eager` off the existing join. Defaults to `None`.
 
     Returns:
         List[sqlalchemy.orm.strategy_options.Load]: A list of the collected
@@ -220,10 +226,23 @@ def _get_query_options(
             inspection=inspection_rel,
             fields_all=fields_rel,
         )
-        # Chain a `joinedload` option to the original `option` join-loading the
-        # requested relationship. In addition, chain a `load_only` limiting to
-        # requested fields for that relationship only.
-        _option = option.joinedload(attr_rel).load_only(*fields_lo_rel)
+        # Chain a loader option to the original `option` eagerly loading the
+        # requested relationship. Collections are loaded via `selectinload`
+        # through a single additional `IN` query thus avoiding the row
+        # multiplication a `JOIN` would incur while scalar relationships are
+        # loaded via `joinedload` within the original query. In addition,
+        # chain a `load_only` limiting to requested fields for that
+        # relationship only.
+        # Relationships already joined in the query are instead populated off
+        # the existing join via `contains_eager` so that the related table
+        # isn't joined a second time.
+        if names_joined and name_rel in names_joined:
+            _option = option.contains_eager(attr_rel)
+        elif prop_rel.uselist:
+            _option = option.selectinload(attr_rel)
+        else:
+            _option = option.joinedload(attr_rel)
+        _option = _option.load_only(*fields_lo_rel)
         # Recurse into the relationship in order to chain any relationships that
         # may be nested under it.
         options += _get_query_options(
@@ -240,6 +259,7 @@ def apply_requested_fields(
     query: sqlalchemy.orm.Query,
     orm_class: Type[OrmBase],
     fields: Optional[Dict] = None,
+    names_joined: Optional[Set[str]] = None,
 ) -> sqlalchemy.orm.Query:
     """Updates the SQLAlchemy Query object by adding `load_only` and
     `joinedload` option.
@@ -262,11 +282,32 @@ def apply_requested_fields(
         orm_class (Type[OrmBaseMixin]): The ORM class of the selected table.
         fields (Optional[Dict]): Pre-extracted requested fields. If
             provided extraction is skipped.
+        names_joined (Optional[Set[str]]): The names of the relationships of
+            the ORM class already joined in the query. These are loaded via
+            `contains_eager` off the existing join and should therefore only
+            include relationships whose join doesn't filter out related
+            records, e.g., many-to-one relationships. Defaults to `None`.
 
     Returns:
         sqlalchemy.orm.Query: The updated SQLAlchemy Query object.
     """
 
+    # Options collected out of the requested fields of the resolved field are
+    # cached per request keyed by the ORM class, the field's AST node, and the
+    # already joined relationships. As the AST node is only reused within the
+    # same parsed document this is skipped when pre-extracted fields are
+    # provided.
+    key = None
+    if not fields:
+        key = (
+            orm_class,
+            id(info.field_asts[0]),
+            frozenset(names_joined or ()),
+        )
+        options = info.context.cache_options.get(key)
+        if options is not None:
+            return query.options(*options)
+
     # Extract the fields requested in the GraphQL query unless they were
     # provided.
     if not fields:
@@ -285,15 +326,67 @@ def apply_requested_fields(
     # relationships.
     options = _get_query_options(
         fields_all=fields[tl_key],
-        inspection=sqlalchemy.inspect(orm_class)
+        inspection=sqlalchemy.inspect(orm_class),
+        names_joined=names_joined,
     )
 
+    if key is not None:
+        info.context.cache_options[key] = options
+
     # Apply the retrieved options to the query.
     query = query.options(*options)
 
     return query
 
 
+def load_relationship(
+    info: graphql.execution.base.ResolveInfo,
+    obj: OrmBase,
+    name_relationship: str,
+    name_loader: str,
+    key,
+):
+    """Retrieves a scalar relationship of a record object deferring to the
+    request data-loaders when the relationship hasn't been eagerly loaded.
+
+    This function allows the resolvers of scalar relationships to coalesce the
+    retrieval of the related record objects of all record objects in a list
+    into a single `IN` query instead of lazy-loading them one by one. Should
+    the relationship have been eagerly loaded, e.g., through the options added
+    by `apply_requested_fields`, then the loaded record object is returned
+    as-is.
+
+    Args:
+        info (graphql.execution.base.ResolveInfo): The GraphQL query info
+            passed to the resolver function.
+        obj (OrmBase): The record object whose relationship is resolved.
+        name_relationship (str): The name of the relationship attribute.
+        name_loader (str): The name of the data-loader under the `loaders` of
+            the context retrieving the related record objects.
+        key: The key via which the related record object is retrieved, i.e.,
+            the value of the foreign-key column.
+
+    Returns:
+        The related record object, `None` if no key is defined, or a promise
+            resolving to the related record object.
+    """
+
+    loaders = info.context.loaders
+
+    # Return the relationship attribute as-is if already loaded or if no
+    # data-loaders are available in which case the relationship is lazy-loaded.
+    if (
+        not loaders or
+        name_relationship not in sqlalchemy.inspect(obj).unloaded
+    ):
+        return getattr(obj, name_relationship)
+
+    if key is None:
+        return None
+
+    return loaders[name_loader].load(key)
+
+
 def check_auth(
     info: graphene.ResolveInfo,
     auth0_user_id: str,
@@ -318,8 +411,8 @@ def check_auth(
 
     # Retrieve the application configuration and JWT token payload out of
     # the context.
-    token_payload = info.context.get("token_payload")
-    cfg = info.context.get("cfg")
+    token_payload = info.context.token_payload
+    cfg = info.context.cfg
 
     # If the value of the token `sub` field does not contain either the
     # provided `customer_id` or the configured `client_id` (used in
@@ -0,0 +1,114 @@
+# coding=utf-8
+
+import time
+import threading
+import unittest
+from unittest import mock
+
+from ffgraphql.middlewares.auth0 import Auth0Jwks
+from ffgraphql.middlewares.auth0 import MiddlewareAuth0
+
+
+class MiddlewareAuth0Test(unittest.TestCase):
+
+    def setUp(self):
+        self.jwks = Auth0Jwks(
+            keys_by_kid={"kid": {"kid": "kid"}},
+            ttl=MiddlewareAuth0.JWKS_TTL_MIN,
+        )
+
+        # Create the middleware without retrieving the JWKS or starting the
+        # refresh timer.
+        with mock.patch.object(
+            MiddlewareAuth0,
+            "_get_jwks",
+            return_value=self.jwks,
+        ), mock.patch.object(MiddlewareAuth0, "_schedule_jwks_refresh"):
+            self.middleware = MiddlewareAuth0(
+                auth0_domain="fightfor.auth0.com",
+                auth0_audience="https://api.fightfor.app",
+                auth0_jwks_url="https://fightfor.auth0.com/jwks.json",
+            )
+
+    def test_get_http_per_process(self):
+        """ Tests that the HTTP session is reused within a process and
+            recreated in a forked process.
+        """
+
+        with mock.patch("os.getpid", return_value=1):
+            http_parent = self.middleware._get_http()
+            self.assertIs(self.middleware._get_http(), http_parent)
+
+        with mock.patch("os.getpid", return_value=2):
+            http_child = self.middleware._get_http()
+
+        self.assertIsNot(http_child, http_parent)
+
+    def test_ensure_jwks_refresh_per_process(self):
+        """ Tests that the JWKS refresh is scheduled once in each process upon
+            retrieving a key.
+        """
+
+        with mock.patch.object(
+            self.middleware,
+            "_schedule_jwks_refresh",
+        ) as mock_schedule, mock.patch("os.getpid", return_value=2):
+            self.middleware._get_rsa_key(kid="kid")
+            self.middleware._jwks_timer_pid = 2
+            self.middleware._get_rsa_key(kid="kid")
+
+        self.assertEqual(mock_schedule.call_count, 1)
+
+    def test_refresh_jwks_malformed(self):
+        """ Tests that a malformed JWKS retains the previous JWKS and
+            reschedules the refresh after the cooldown.
+        """
+
+        with mock.patch.object(
+            self.middleware,
+            "_get_jwks",
+            side_effect=KeyError("keys"),
+        ), mock.patch.object(
+            self.middleware,
+            "_schedule_jwks_refresh",
+        ) as mock_schedule:
+            self.middleware._refresh_jwks()
+
+        self.assertIs(self.middleware.jwks, self.jwks)
+        mock_schedule.assert_called_once_with(
+            interval=MiddlewareAuth0.JWKS_REFRESH_COOLDOWN,
+        )
+
+    def test_get_rsa_key_unknown_kid_concurrent(self):
+        """ Tests that concurrent lookups of an unknown key ID trigger a single
+            JWKS retrieval.
+        """
+
+        def get_jwks(jwks):
+            time.sleep(0.05)
+            return self.jwks
+
+        self.middleware._jwks_refreshed_at -= (
+            MiddlewareAuth0.JWKS_REFRESH_COOLDOWN
+        )
+
+        with mock.patch.object(
+            self.middleware,
+            "_get_jwks",
+            side_effect=get_jwks,
+        ) as mock_get_jwks, mock.patch.object(
+            self.middleware,
+            "_schedule_jwks_refresh",
+        ):
+            threads = [
+                threading.Thread(
+                    target=self.middleware._get_rsa_key,
+                    kwargs={"kid": "unknown"},
+                ) for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(mock_get_jwks.call_count, 1)
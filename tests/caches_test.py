@@ -0,0 +1,61 @@
+# coding=utf-8
+
+import unittest
+from unittest import mock
+
+from ffgraphql.caches import CacheLru
+
+
+class CacheLruTest(unittest.TestCase):
+
+    def test_get_set(self):
+        """ Tests that cached values are retrieved and missing keys yield the
+            default.
+        """
+
+        cache = CacheLru(maxsize=2)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", default=2), 2)
+
+    def test_evict_least_recently_used(self):
+        """ Tests that the least-recently-used entry is evicted once the cache
+            is full.
+        """
+
+        cache = CacheLru(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_ttl(self):
+        """ Tests that entries expire after their TTL."""
+
+        cache = CacheLru(maxsize=2, ttl=60)
+
+        with mock.patch("time.monotonic", return_value=0):
+            cache.set("a", 1)
+        with mock.patch("time.monotonic", return_value=59):
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch("time.monotonic", return_value=60):
+            self.assertIsNone(cache.get("a"))
+
+    def test_pop_clear(self):
+        """ Tests that entries are removed via `pop` and `clear`."""
+
+        cache = CacheLru(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.get("a"))
+
+        cache.clear()
+        self.assertIsNone(cache.get("b"))
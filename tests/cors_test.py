@@ -0,0 +1,66 @@
+# coding=utf-8
+
+import unittest
+
+import falcon
+import falcon.testing
+
+from ffgraphql.middlewares.cors import MiddlewareCors
+
+
+class ResourceDummy(object):
+
+    def on_post(self, req, resp):
+        resp.status = falcon.HTTP_200
+
+
+class MiddlewareCorsTest(unittest.TestCase):
+
+    def setUp(self):
+        router = falcon.routing.CompiledRouter()
+        api = falcon.API(
+            router=router,
+            middleware=[MiddlewareCors(router=router)],
+        )
+        api.add_route(uri_template="/graphql", resource=ResourceDummy())
+
+        self.client = falcon.testing.TestClient(api)
+
+    def preflight(self, path: str, method: str) -> falcon.testing.Result:
+        return self.client.simulate_options(
+            path=path,
+            headers={
+                "Origin": "https://fightfor.app",
+                "Access-Control-Request-Method": method,
+            },
+        )
+
+    def test_preflight(self):
+        """ Tests that a preflight request to an existing route for a
+            supported method is responded to with the methods of the resource.
+        """
+
+        result = self.preflight(path="/graphql", method="POST")
+
+        self.assertEqual(result.status, falcon.HTTP_200)
+        self.assertEqual(
+            result.headers["Access-Control-Allow-Methods"],
+            "OPTIONS, POST",
+        )
+        self.assertEqual(result.headers["Access-Control-Allow-Origin"], "*")
+
+    def test_preflight_unknown_route(self):
+        """ Tests that a preflight request to an unknown route yields a 404."""
+
+        result = self.preflight(path="/unknown", method="POST")
+
+        self.assertEqual(result.status, falcon.HTTP_404)
+
+    def test_preflight_unsupported_method(self):
+        """ Tests that a preflight request for a method the resource doesn't
+            respond to yields a 405.
+        """
+
+        result = self.preflight(path="/graphql", method="GET")
+
+        self.assertEqual(result.status, falcon.HTTP_405)
@@ -0,0 +1,383 @@
+# coding=utf-8
+
+import uuid
+import unittest
+
+from graphene.test import Client
+import sqlalchemy.orm
+from fform.dal_base import DalBase
+
+from ffgraphql.config import import_config
+from ffgraphql.context import ContextGraphQl
+from ffgraphql.loaders import create_loaders
+from ffgraphql.schema import schema
+from ffgraphql.middlewares.savepoint import MiddlewareSavepoint
+from ffgraphql.types.app_primitives import ModelSearch
+from ffgraphql.types.app_primitives import ModelSearchDescriptor
+from ffgraphql.types.mt_primitives import ModelDescriptor
+from ffgraphql.mutations.utils import get_user_id
+from ffgraphql.mutations.utils import COPY_THRESHOLD_SEARCH_DESCRIPTORS
+
+
+class MutationTestBase(unittest.TestCase):
+    """ Base test-case executing mutations against the SQL database within a
+        transaction that is rolled back after each test.
+    """
+
+    def setUp(self):
+        self.cfg = import_config(
+            fname_config_file="/etc/fightfor-graphql/fightfor-graphql.json",
+        )
+
+        dal = DalBase(
+            sql_username=self.cfg.sql_username,
+            sql_password=self.cfg.sql_password,
+            sql_host=self.cfg.sql_host,
+            sql_port=self.cfg.sql_port,
+            sql_db=self.cfg.sql_db,
+            sql_engine_echo=self.cfg.logger_level == "DEBUG",
+        )
+
+        # Prepare a DB session bound to a connection with an open transaction
+        # so that all changes can be rolled back.
+        self.connection = dal.engine.connect()
+        self.transaction = self.connection.begin()
+        session_maker = sqlalchemy.orm.sessionmaker(bind=self.connection)
+        self.session = session_maker()
+
+        # Prepare a Graphene client.
+        self.client = Client(schema)
+
+    def tearDown(self):
+        self.session.close()
+        self.transaction.rollback()
+        self.connection.close()
+
+    def execute(
+        self,
+        query: str,
+        variable_values=None,
+        middleware=None,
+    ) -> dict:
+        """ Executes a GraphQL query with a context authorized through the
+            service-to-service client ID.
+        """
+
+        context = ContextGraphQl(
+            cfg=self.cfg,
+            token="",
+            token_payload={
+                "sub": "{}@clients".format(self.cfg.auth0.client_id),
+            },
+            session=self.session,
+            loaders=create_loaders(session=self.session),
+        )
+
+        return self.client.execute(
+            query,
+            context_value=context,
+            variable_values=variable_values,
+            middleware=middleware,
+        )
+
+
+class MutationUserUpsertTest(MutationTestBase):
+
+    query = """
+        mutation upsertUser($auth0UserId: String!, $email: String!) {
+          upsertUser(user: {auth0UserId: $auth0UserId, email: $email}) {
+            user {
+              userId
+              auth0UserId
+              email
+            }
+          }
+        }
+    """
+
+    def test_upsert_user_insert(self):
+        """ Tests that a new user is inserted and returned."""
+
+        result = self.execute(
+            query=self.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "email": "test-upsert-user@fightfor.app",
+            },
+        )
+
+        self.assertNotIn("errors", result)
+        user = result["data"]["upsertUser"]["user"]
+        self.assertEqual(user["auth0UserId"], "test-upsert-user")
+        self.assertEqual(user["email"], "test-upsert-user@fightfor.app")
+        self.assertIsNotNone(user["userId"])
+
+    def test_upsert_user_update(self):
+        """ Tests that upserting an existing user updates its email and keeps
+            its ID.
+        """
+
+        result_insert = self.execute(
+            query=self.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "email": "test-upsert-user@fightfor.app",
+            },
+        )
+        result_update = self.execute(
+            query=self.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "email": "test-upsert-user-new@fightfor.app",
+            },
+        )
+
+        self.assertNotIn("errors", result_update)
+        user_insert = result_insert["data"]["upsertUser"]["user"]
+        user_update = result_update["data"]["upsertUser"]["user"]
+        self.assertEqual(user_update["userId"], user_insert["userId"])
+        self.assertEqual(
+            user_update["email"],
+            "test-upsert-user-new@fightfor.app",
+        )
+
+
+class MutationUserDeleteTest(MutationTestBase):
+
+    query_upsert = MutationUserUpsertTest.query
+
+    query_delete = """
+        mutation deleteUser($auth0UserId: String!) {
+          deleteUser(auth0UserId: $auth0UserId) {
+            user {
+              userId
+            }
+          }
+        }
+    """
+
+    def test_delete_user_recreate(self):
+        """ Tests that the ID of a deleted and re-created user is retrieved
+            anew rather than reused.
+        """
+
+        variable_values = {
+            "auth0UserId": "auth0|test-upsert-user",
+            "email": "test-upsert-user@fightfor.app",
+        }
+
+        result = self.execute(
+            query=self.query_upsert,
+            variable_values=variable_values,
+        )
+        user_id_old = result["data"]["upsertUser"]["user"]["userId"]
+        self.assertEqual(
+            str(get_user_id(
+                session=self.session,
+                auth0_user_id="test-upsert-user",
+            )),
+            user_id_old,
+        )
+
+        self.execute(
+            query=self.query_delete,
+            variable_values={"auth0UserId": "auth0|test-upsert-user"},
+        )
+        result = self.execute(
+            query=self.query_upsert,
+            variable_values=variable_values,
+        )
+        user_id_new = result["data"]["upsertUser"]["user"]["userId"]
+
+        self.assertNotEqual(user_id_new, user_id_old)
+        self.assertEqual(
+            str(get_user_id(
+                session=self.session,
+                auth0_user_id="test-upsert-user",
+            )),
+            user_id_new,
+        )
+
+
+class MutationSearchUpsertTest(MutationTestBase):
+
+    query = """
+        mutation upsertSearch(
+          $auth0UserId: String!,
+          $searchUuid: UUID!,
+          $title: String!
+        ) {
+          upsertSearch(
+            auth0UserId: $auth0UserId,
+            search: {searchUuid: $searchUuid, title: $title},
+            meshDescriptorIds: []
+          ) {
+            search {
+              searchId
+              searchUuid
+              title
+            }
+          }
+        }
+    """
+
+    def setUp(self):
+        super(MutationSearchUpsertTest, self).setUp()
+
+        self.execute(
+            query=MutationUserUpsertTest.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "email": "test-upsert-user@fightfor.app",
+            },
+        )
+
+    def test_upsert_search(self):
+        """ Tests that upserting a search inserts it and upserting it again
+            updates its attributes and keeps its ID.
+        """
+
+        search_uuid = str(uuid.uuid4())
+
+        result_insert = self.execute(
+            query=self.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "searchUuid": search_uuid,
+                "title": "Search",
+            },
+        )
+        result_update = self.execute(
+            query=self.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "searchUuid": search_uuid,
+                "title": "Search Updated",
+            },
+        )
+
+        self.assertNotIn("errors", result_insert)
+        self.assertNotIn("errors", result_update)
+        search_insert = result_insert["data"]["upsertSearch"]["search"]
+        search_update = result_update["data"]["upsertSearch"]["search"]
+        self.assertEqual(search_insert["searchUuid"], search_uuid)
+        self.assertEqual(search_insert["title"], "Search")
+        self.assertEqual(search_update["searchId"], search_insert["searchId"])
+        self.assertEqual(search_update["title"], "Search Updated")
+
+    def test_upsert_search_descriptors_copy(self):
+        """ Tests that search descriptors above the `COPY` threshold are all
+            upserted through the temporary table.
+        """
+
+        query = self.session.query(ModelDescriptor.descriptor_id)
+        query = query.limit(COPY_THRESHOLD_SEARCH_DESCRIPTORS + 1)
+        descriptor_ids = [result[0] for result in query.all()]
+
+        result = self.execute(
+            query="""
+                mutation upsertSearch(
+                  $auth0UserId: String!,
+                  $searchUuid: UUID!,
+                  $meshDescriptorIds: [Int]
+                ) {
+                  upsertSearch(
+                    auth0UserId: $auth0UserId,
+                    search: {searchUuid: $searchUuid, title: "Search"},
+                    meshDescriptorIds: $meshDescriptorIds
+                  ) {
+                    search {
+                      searchId
+                    }
+                  }
+                }
+            """,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "searchUuid": str(uuid.uuid4()),
+                "meshDescriptorIds": descriptor_ids,
+            },
+        )
+
+        self.assertNotIn("errors", result)
+        search_id = result["data"]["upsertSearch"]["search"]["searchId"]
+        query = self.session.query(ModelSearchDescriptor.descriptor_id)
+        query = query.filter(ModelSearchDescriptor.search_id == int(search_id))
+        self.assertSetEqual(
+            {result[0] for result in query.all()},
+            set(descriptor_ids),
+        )
+
+
+class MiddlewareSavepointTest(MutationTestBase):
+
+    query = """
+        mutation upsertSearches(
+          $auth0UserId: String!,
+          $searchUuidValid: UUID!,
+          $searchUuidInvalid: UUID!
+        ) {
+          valid: upsertSearch(
+            auth0UserId: $auth0UserId,
+            search: {searchUuid: $searchUuidValid, title: "Valid"},
+            meshDescriptorIds: []
+          ) {
+            search {
+              searchId
+            }
+          }
+          invalid: upsertSearch(
+            auth0UserId: $auth0UserId,
+            search: {searchUuid: $searchUuidInvalid, title: "Invalid"},
+            meshDescriptorIds: [-1]
+          ) {
+            search {
+              searchId
+            }
+          }
+        }
+    """
+
+    def setUp(self):
+        super(MiddlewareSavepointTest, self).setUp()
+
+        self.execute(
+            query=MutationUserUpsertTest.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "email": "test-upsert-user@fightfor.app",
+            },
+        )
+
+    def test_mutation_failing_rolled_back(self):
+        """ Tests that a failing mutation only rolls back its own changes and
+            leaves those of the preceding mutation and the session intact.
+        """
+
+        search_uuid_valid = str(uuid.uuid4())
+        search_uuid_invalid = str(uuid.uuid4())
+
+        result = self.execute(
+            query=self.query,
+            variable_values={
+                "auth0UserId": "auth0|test-upsert-user",
+                "searchUuidValid": search_uuid_valid,
+                "searchUuidInvalid": search_uuid_invalid,
+            },
+            middleware=[MiddlewareSavepoint()],
+        )
+
+        self.assertIn("errors", result)
+        self.assertIsNotNone(result["data"]["valid"])
+        self.assertIsNone(result["data"]["invalid"])
+
+        query = self.session.query(ModelSearch.search_uuid)
+        query = query.filter(
+            ModelSearch.search_uuid.in_(
+                [search_uuid_valid, search_uuid_invalid],
+            )
+        )
+        self.assertListEqual(
+            [str(result[0]) for result in query.all()],
+            [search_uuid_valid],
+        )
@@ -0,0 +1,64 @@
+# coding=utf-8
+
+import unittest
+
+from graphql import parse
+
+from ffgraphql.resources import ResourceGraphQl
+
+
+class ResourceGraphQlTest(unittest.TestCase):
+
+    def setUp(self):
+        self.resource = ResourceGraphQl(cfg=None, schema=None)
+
+    def is_cacheable(self, query: str) -> bool:
+        return self.resource._is_document_cacheable(
+            document_ast=parse(query),
+        )
+
+    def test_is_document_cacheable_citations_by_id(self):
+        """ Tests that citation retrievals by ID and PubMed ID are cached."""
+
+        query = """
+            query {
+              citations {
+                byId(citationIds: [1, 2]) { citationId }
+                byPmid(pmids: [1, 2]) { citationId }
+              }
+            }
+        """
+
+        self.assertTrue(self.is_cacheable(query=query))
+
+    def test_is_document_cacheable_citations_search(self):
+        """ Tests that citation searches aren't cached."""
+
+        query = """
+            query {
+              citations {
+                byId(citationIds: [1, 2]) { citationId }
+                search(meshDescriptorIds: [1]) { citationId }
+              }
+            }
+        """
+
+        self.assertFalse(self.is_cacheable(query=query))
+
+    def test_is_document_cacheable_mutation(self):
+        """ Tests that mutations aren't cached."""
+
+        query = """
+            mutation {
+              deleteUser(auth0UserId: "auth0|test") { user { userId } }
+            }
+        """
+
+        self.assertFalse(self.is_cacheable(query=query))
+
+    def test_is_document_cacheable_no_selection(self):
+        """ Tests that root fields without a sub-selection, which fail
+            validation upon execution, aren't cached.
+        """
+
+        self.assertFalse(self.is_cacheable(query="{ citations }"))
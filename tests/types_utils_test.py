@@ -0,0 +1,101 @@
+# coding=utf-8
+
+import unittest
+
+import sqlalchemy.orm
+from fform.dal_base import DalBase
+
+from ffgraphql.config import import_config
+from ffgraphql.types.mt_primitives import ModelDescriptorTreeNumber
+from ffgraphql.types.mt_primitives import ModelTreeNumber
+from ffgraphql.types.utils import cache_descriptor_children
+from ffgraphql.types.utils import get_descriptor_children
+
+
+class GetDescriptorChildrenTest(unittest.TestCase):
+
+    def setUp(self):
+        cfg = import_config(
+            fname_config_file="/etc/fightfor-graphql/fightfor-graphql.json",
+        )
+
+        dal = DalBase(
+            sql_username=cfg.sql_username,
+            sql_password=cfg.sql_password,
+            sql_host=cfg.sql_host,
+            sql_port=cfg.sql_port,
+            sql_db=cfg.sql_db,
+            sql_engine_echo=cfg.logger_level == "DEBUG",
+        )
+
+        # Prepare a DB session.
+        session_maker = sqlalchemy.orm.sessionmaker(bind=dal.engine)
+        self.session = session_maker()
+
+        cache_descriptor_children.clear()
+
+    def tearDown(self):
+        self.session.close()
+
+        cache_descriptor_children.clear()
+
+    def test_get_descriptor_children(self):
+        """ Tests that the children of a descriptor are those with a
+            tree-number nested under one of its tree-numbers and include the
+            descriptor itself.
+        """
+
+        # Retrieve a descriptor and one of its tree-numbers.
+        query = self.session.query(
+            ModelDescriptorTreeNumber.descriptor_id,
+            ModelTreeNumber.tree_number,
+        )
+        query = query.select_from(ModelTreeNumber)
+        query = query.join(ModelTreeNumber.descriptor_tree_numbers)
+        descriptor_id, tree_number = query.first()
+
+        # Retrieve the expected children through a constant `LIKE` pattern.
+        query = self.session.query(ModelDescriptorTreeNumber.descriptor_id)
+        query = query.select_from(ModelTreeNumber)
+        query = query.join(ModelTreeNumber.descriptor_tree_numbers)
+        query = query.filter(
+            sqlalchemy.or_(
+                ModelTreeNumber.tree_number == tree_number,
+                ModelTreeNumber.tree_number.like("{}.%".format(tree_number)),
+            )
+        )
+        descriptor_ids_expected = {result[0] for result in query.all()}
+
+        map_descriptor_children = get_descriptor_children(
+            session=self.session,
+            descriptor_ids=[descriptor_id],
+        )
+
+        self.assertIn(descriptor_id, map_descriptor_children[descriptor_id])
+        self.assertTrue(
+            descriptor_ids_expected.issubset(
+                map_descriptor_children[descriptor_id],
+            )
+        )
+
+    def test_get_descriptor_children_cached(self):
+        """ Tests that the children are cached irrespective of the order of the
+            provided descriptor IDs.
+        """
+
+        query = self.session.query(ModelDescriptorTreeNumber.descriptor_id)
+        query = query.distinct().limit(2)
+        descriptor_ids = [result[0] for result in query.all()]
+
+        map_descriptor_children = get_descriptor_children(
+            session=self.session,
+            descriptor_ids=descriptor_ids,
+        )
+
+        self.assertIs(
+            get_descriptor_children(
+                session=self.session,
+                descriptor_ids=list(reversed(descriptor_ids)),
+            ),
+            map_descriptor_children,
+        )